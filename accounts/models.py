@@ -13,6 +13,11 @@ class User(AbstractUser):
     bio = models.TextField(blank=True, null=True)
     birth_date = models.DateField(blank=True, null=True)
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=['-date_joined', '-id'], name='user_date_joined_idx'),
+        ]
+
     def __str__(self):
         return self.get_full_name() or self.username
 
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import tempfile
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -49,6 +50,10 @@ CSRF_TRUSTED_ORIGINS = ['https://youthinno.uz', 'https://www.youthinno.uz']
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'dashboard.static.StaticFilesMiddleware',
+    'dashboard.compression.CompressionMiddleware',
+    'dashboard.assets.PreloadHeadersMiddleware',
+    'dashboard.db.DatabaseRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -70,6 +75,7 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
                 'dashboard.context_processors.pending_applications',
+                'dashboard.context_processors.site_settings',
             ],
         },
     },
@@ -85,9 +91,87 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            # Yozuvchi tranzaksiya boshidayoq qulfni oladi, "database is locked"
+            # xatosi o'rniga busy_timeout davomida navbat kutiladi
+            'transaction_mode': 'IMMEDIATE',
+        },
+        # Testlar ham fayldagi bazada: xotiradagi (shared-cache) baza qulfni kutmay
+        # "table is locked" beradi va parallel so'rovlar testini buzadi.
+        # Fayl loyiha papkasida emas, vaqtinchalik papkada
+        'TEST': {
+            'NAME': Path(tempfile.gettempdir()) / f'{BASE_DIR.name}-test.sqlite3',
+        },
+    },
+    # GET so'rovlari uchun faqat o'qish rejimidagi ulanish (dashboard.db.ReadReplicaRouter).
+    # Keyinchalik replika serverga yo'naltirish uchun shu yerni o'zgartirish kifoya.
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': (BASE_DIR / 'db.sqlite3').as_uri() + '?mode=ro',
+        'OPTIONS': {
+            'uri': True,
+        },
+        'TEST': {
+            'MIRROR': 'default',
+        },
+    },
+}
+
+DATABASE_ROUTERS = ['dashboard.db.ReadReplicaRouter']
+
+# Yozuvdan keyin foydalanuvchi so'rovlari asosiy bazada qoladigan vaqt (soniya)
+DATABASE_PIN_SECONDS = 10
+
+# Har bir SQLite ulanishida bajariladigan PRAGMA'lar (dashboard.db.configure_sqlite)
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'cache_size': -20000,
+    'mmap_size': 128 * 1024 * 1024,
+    'temp_store': 'MEMORY',
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+# Kesh barcha worker va management buyruqlari uchun umumiy bo'lishi kerak,
+# aks holda signal orqali bekor qilish boshqa jarayonlarga yetib bormaydi.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache',
+        'OPTIONS': {
+            # Har bir set() kesh papkasidagi barcha fayllarni sanaydi (_cull), shuning
+            # uchun chegara kichik: 1000 ta fayl ro'yxati millisekunddan kam. To'lganda
+            # chorak qismi o'chiriladi; versiya kaliti o'chsa faqat tegishli kesh
+            # qayta quriladi. Bir nechta server bo'lsa — RedisCache ga o'tish kerak.
+            'MAX_ENTRIES': 1000,
+            'CULL_FREQUENCY': 4,
+        },
     }
 }
 
+# Landing sahifasi keshi (soniya)
+LANDING_CACHE_TIMEOUT = 60 * 15
+
+# Sozlamalar, laboratoriyalar va hamkorlar keshi (soniya)
+REFERENCE_CACHE_TIMEOUT = 60 * 60
+
+# Kutilayotgan arizalar hisoblagichi qayta sanalguncha (soniya). Signal kalitni
+# o'chiradi; muddat faqat o'chirish bilan bir vaqtda yozilgan eski sonni cheklaydi
+PENDING_COUNT_TIMEOUT = 60 * 5
+
+# Admin paneli bosh sahifasidagi ko'rsatkichlar keshi (soniya)
+DASHBOARD_STATS_TIMEOUT = 60
+
+# Talaba bosh sahifasi: shaxsiy qism va umumiy lenta keshi (soniya)
+STUDENT_HOME_CACHE_TIMEOUT = 60 * 10
+
+# Dasturlar katalogidagi facet sonlari keshi (soniya)
+CATALOG_CACHE_TIMEOUT = 60 * 60
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -120,6 +204,13 @@ USE_I18N = True
 USE_TZ = True
 
 
+# HTML minifikatsiya va br/gzip siqish (dashboard.compression.CompressionMiddleware).
+# Sahifa keshidan kelgan javoblarning siqilgan tanasi shuncha vaqt saqlanadi
+COMPRESSION_BROTLI_QUALITY = 5
+COMPRESSION_GZIP_LEVEL = 6
+COMPRESSION_CACHE_TIMEOUT = 60 * 15
+
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/6.0/howto/static-files/
 
@@ -127,8 +218,64 @@ STATIC_URL = 'static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+# DEBUG=False da STATIC_ROOT ni dashboard.static.StaticFilesMiddleware yuboradi.
+# Xeshli nomlar bir yilga keshlanadi, qolganlari shuncha soniyaga
+STATIC_MAX_AGE = 60
+
 MEDIA_URL = 'media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Yuklamalar tarkib xeshi bilan nomlanadi va MEDIA_BLOB_ROOT dagi yagona nusxaga
+# qattiq havola qilinadi (MEDIA_ROOT bilan bir fayl tizimida bo'lishi kerak).
+# Fayl URL lari o'zgarmas — veb-serverda muddatsiz keshlash mumkin.
+MEDIA_BLOB_ROOT = BASE_DIR / 'media_blobs'
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'dashboard.storage.ContentAddressedStorage',
+    },
+    'private': {
+        'BACKEND': 'dashboard.storage.ContentAddressedStorage',
+        'OPTIONS': {
+            'location': BASE_DIR / 'private_media',
+            'base_url': '/protected/',
+        },
+    },
+    # collectstatic xeshli nomlar va .gz/.br nusxalar yaratadi; DEBUG=False da
+    # {% static %} manifestdan o'qiydi, shuning uchun deploydan oldin collectstatic shart
+    'staticfiles': {
+        'BACKEND': 'dashboard.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
+# Sertifikatlar kabi himoyalangan fayllar ('private' saqlagich) faqat ruxsat tekshiruvidan
+# keyin yuboriladi. Baytlarni kim yuboradi:
+#   None       — Django o'zi (FileResponse, Range qo'llanadi)
+#   'nginx'    — X-Accel-Redirect: location /protected/ { internal; alias <private_media>/; }
+#   'sendfile' — Apache mod_xsendfile / lighttpd X-Sendfile
+PROTECTED_MEDIA_SERVER = None
+PROTECTED_MEDIA_INTERNAL_URL = '/protected/'
+
+# Yuklangan rasmlar uchun yaratiladigan WebP/JPEG kengliklari (px)
+IMAGE_VARIANT_WIDTHS = [64, 160, 320, 640, 1280]
+
+# Asl rasmning eng katta tomoni (px); kattaroq yuklamalar worker'da kichraytiriladi
+IMAGE_MAX_DIMENSION = 2560
+
+# Rasm ishlovi worker'i (manage.py process_image_jobs)
+IMAGE_WORKERS = 2
+IMAGE_JOB_MAX_ATTEMPTS = 3
+IMAGE_JOB_POLL_SECONDS = 2
+# Shuncha vaqt 'processing' holatida turgan vazifa to'xtagan worker'niki hisoblanadi
+IMAGE_JOB_STALE_SECONDS = 60 * 10
+
+# Arizalarni avval mahalliy jurnalga yozib, bazaga drain_applications orqali
+# paketlab o'tkazish (ro'yxatga olish ochilgan paytdagi yuklama uchun).
+# Yoqilganda drain_applications doimiy ishlab turishi kerak.
+APPLICATION_QUEUE = False
+APPLICATION_QUEUE_DIR = BASE_DIR / 'queue'
+APPLICATION_QUEUE_BATCH = 200
+APPLICATION_QUEUE_POLL_SECONDS = 1
+
 LOGIN_URL = '/login/'
 LOGIN_REDIRECT_URL = '/login/'
@@ -3,3 +3,13 @@ from django.apps import AppConfig
 
 class DashboardConfig(AppConfig):
     name = 'dashboard'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from django.db.models.signals import post_delete, post_save
+        from . import checks, signals  # noqa: F401
+        from .db import configure_sqlite, mark_written
+
+        connection_created.connect(configure_sqlite, dispatch_uid='dashboard_configure_sqlite')
+        post_save.connect(mark_written, dispatch_uid='dashboard_db_mark_written_save')
+        post_delete.connect(mark_written, dispatch_uid='dashboard_db_mark_written_delete')
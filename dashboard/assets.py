@@ -0,0 +1,112 @@
+import json
+from functools import cache
+
+from django.contrib.staticfiles import finders
+from django.templatetags.static import static
+
+VENDOR_DIR = 'vendor'
+
+# Tashqi front-end kutubxonalar: static ichidagi nusxa va u hali yo'q bo'lsa CDN manzili.
+# Nusxalarni manage.py vendor_assets yuklab oladi (internetli mashinada bir marta).
+ASSETS = {
+    'bootstrap-css': (
+        'vendor/bootstrap/bootstrap.min.css',
+        'https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css',
+    ),
+    'bootstrap-js': (
+        'vendor/bootstrap/bootstrap.bundle.min.js',
+        'https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js',
+    ),
+    'bootstrap-icons': (
+        'vendor/bootstrap-icons/bootstrap-icons.css',
+        'https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.3/font/bootstrap-icons.min.css',
+    ),
+    'aos-css': (
+        'vendor/aos/aos.css',
+        'https://cdn.jsdelivr.net/npm/aos@2.3.4/dist/aos.css',
+    ),
+    'aos-js': (
+        'vendor/aos/aos.js',
+        'https://cdn.jsdelivr.net/npm/aos@2.3.4/dist/aos.js',
+    ),
+    'fonts-landing': (
+        'vendor/fonts/landing.css',
+        'https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800;900'
+        '&family=Space+Grotesk:wght@400;500;600;700&display=swap',
+    ),
+    'fonts-app': (
+        'vendor/fonts/app.css',
+        'https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700'
+        '&family=Montserrat:wght@600;700;800&family=JetBrains+Mono:wght@400;500&display=swap',
+    ),
+}
+
+# vendor_assets yozgan fayllardan tuzilgan preload ro'yxati: {guruh: [[static yo'l, as]]}.
+# Shrift fayl nomlari Google Fonts javobiga bog'liq, shuning uchun qo'lda yozilmaydi.
+PRELOAD_MANIFEST = f'{VENDOR_DIR}/preloads.json'
+
+# Sahifa turlari bo'yicha loyihaning o'z resurslari (static yo'l, as)
+PROJECT_PRELOADS = {
+    'landing': [('css/landing.css', 'style')],
+    'app': [],
+}
+
+
+@cache
+def vendor_preloads():
+    path = finders.find(PRELOAD_MANIFEST)
+    if path is None:
+        return {}
+    with open(path) as fh:
+        return {group: [tuple(item) for item in items] for group, items in json.load(fh).items()}
+
+
+@cache
+def is_vendored(path):
+    return finders.find(path) is not None
+
+
+def asset_url(key):
+    """Kutubxona manzili: static nusxa bo'lsa o'sha, aks holda CDN."""
+    path, cdn_url = ASSETS[key]
+    return static(path) if is_vendored(path) else cdn_url
+
+
+def preload_links(group, extra=()):
+    """[(url, as)] — faqat mavjud static fayllar uchun."""
+    return [
+        (static(path), kind)
+        for path, kind in [*vendor_preloads().get(group, []), *PROJECT_PRELOADS[group], *extra]
+        if is_vendored(path)
+    ]
+
+
+def add_preloads(request, links):
+    # Javob sarlavhasini PreloadHeadersMiddleware yozadi
+    preloads = getattr(request, 'preloads', [])
+    preloads.extend(link for link in links if link not in preloads)
+    request.preloads = preloads
+
+
+def link_header(links):
+    parts = []
+    for url, kind in links:
+        part = f'<{url}>; rel=preload; as={kind}'
+        if kind == 'font':
+            part += '; type="font/woff2"; crossorigin'
+        parts.append(part)
+    return ', '.join(parts)
+
+
+class PreloadHeadersMiddleware:
+    """Shablon so'ragan preload resurslarini HTTP Link sarlavhasi sifatida ham yuborish."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        preloads = getattr(request, 'preloads', None)
+        if preloads and 'Link' not in response:
+            response['Link'] = link_header(preloads)
+        return response
@@ -0,0 +1,97 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from .cache import invalidate_pending_count
+from .models import Application, Certificate
+from .signals import applications_changed
+from .stats import invalidate_stats
+
+STATUSES = ('pending', 'approved', 'rejected')
+# Bitta INSERT/IN ro'yxatidagi sertifikatlar soni (SQLite o'zgaruvchilar chegarasi)
+BATCH_SIZE = 500
+
+
+def _invalidate(user_ids):
+    # update() va bulk_create() signallarni chaqirmaydi — signal bajaradigan tozalash shu yerda
+    transaction.on_commit(invalidate_pending_count)
+    transaction.on_commit(invalidate_stats)
+    applications_changed.send(sender=Application, user_ids=user_ids)
+
+
+def set_status(queryset, status):
+    """
+    Tanlangan arizalar holatini bitta UPDATE bilan almashtirish.
+    {eski holat: nechta ariza o'tkazildi} qaytaradi.
+    """
+    changing = queryset.exclude(status=status)
+    with transaction.atomic():
+        moved, user_ids = Counter(), set()
+        for user_id, old_status, count in (
+            changing.order_by().values_list('user_id', 'status').annotate(count=Count('pk'))
+        ):
+            moved[old_status] += count
+            user_ids.add(user_id)
+        changing.update(status=status, updated_at=timezone.now())
+        if moved:
+            _invalidate(user_ids)
+    return dict(moved)
+
+
+def _create_certificates(queryset):
+    rows = list(queryset.order_by().values_list('pk', 'user_id', 'program_id', 'program__name'))
+    if not rows:
+        return 0
+    # Tanlov qayta so'rov sifatida (subquery) beriladi — IN ro'yxati SQLite
+    # o'zgaruvchilar chegarasiga urilmaydi
+    existing = set(
+        Certificate.objects.filter(
+            user_id__in=queryset.values('user_id'), program_id__in=queryset.values('program_id'),
+        ).values_list('user_id', 'program_id')
+    )
+    today = timezone.localdate()
+    certificates = [
+        # Ariza ID'siga bog'langan raqam — qayta bosilganda ham takror yaratilmaydi
+        Certificate(
+            user_id=user_id, program_id=program_id, title=program_name,
+            certificate_id=f'APP-{pk}', issued_date=today,
+        )
+        for pk, user_id, program_id, program_name in rows
+        if (user_id, program_id) not in existing
+    ]
+    if not certificates:
+        return 0
+    created = 0
+    with transaction.atomic():
+        for start in range(0, len(certificates), BATCH_SIZE):
+            batch = certificates[start:start + BATCH_SIZE]
+            # Faqat shu chaqiruv yaratgan raqamlar sanaladi (butun jadval emas)
+            ids = Certificate.objects.filter(certificate_id__in=[certificate.certificate_id for certificate in batch])
+            before = ids.count()
+            Certificate.objects.bulk_create(batch, ignore_conflicts=True)
+            created += ids.count() - before
+        if created:
+            _invalidate({certificate.user_id for certificate in certificates})
+    return created
+
+
+def issue_certificates(queryset):
+    """
+    Tasdiqlangan arizalar egalariga sertifikat yaratish. Shu dastur bo'yicha
+    sertifikati bor talabalar o'tkazib yuboriladi; yaratilganlar sonini qaytaradi.
+    """
+    return _create_certificates(queryset.filter(status='approved'))
+
+
+def approve(queryset, issue=False):
+    """
+    Tanlovni tasdiqlash va kerak bo'lsa sertifikat berish, bitta tranzaksiyada.
+    Sertifikatlar UPDATE dan oldin yaratiladi: holat filtri (?status=pending)
+    UPDATE dan keyin boshqa qatorlarni tanlaydi. (set_status natijasi, yaratilgan sertifikatlar soni).
+    """
+    with transaction.atomic():
+        created = _create_certificates(queryset) if issue else 0
+        moved = set_status(queryset, 'approved')
+    return moved, created
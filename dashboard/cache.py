@@ -0,0 +1,118 @@
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import Application, Laboratory, Partner, SiteSetting
+
+REFERENCE_NAMES = ('site_settings', 'laboratories', 'partners')
+PENDING_COUNT_KEY = 'applications:pending_count'
+# Rasm variantlari tayyor bo'lganda almashadigan versiya (sahifa keshi va ETag uchun)
+IMAGES_VERSION = 'images'
+
+# Statistika har bir so'rovda keshga yozilmasligi uchun jarayon ichida
+# yig'iladi va har STATS_FLUSH_EVERY ta hodisada umumiy keshga qo'shiladi.
+STATS_FLUSH_EVERY = 20
+
+_missing = object()
+_pending_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def _version_key(name):
+    return f'ref:{name}:version'
+
+
+def _stats_key(name, outcome):
+    return f'ref:stats:{name}:{outcome}'
+
+
+def _record(name, outcome):
+    with _stats_lock:
+        _pending_stats[name, outcome] += 1
+        delta = _pending_stats[name, outcome]
+        if delta < STATS_FLUSH_EVERY:
+            return
+        _pending_stats[name, outcome] = 0
+    _add_to_stats(name, outcome, delta)
+
+
+def _add_to_stats(name, outcome, delta):
+    # cache.incr() fayl keshida muddatni standart qiymatga qaytaradi
+    key = _stats_key(name, outcome)
+    cache.set(key, cache.get(key, 0) + delta, None)
+
+
+def get_stats():
+    """{nom: {'hits': n, 'misses': n}} ko'rinishidagi statistika."""
+    keys = [_stats_key(name, outcome) for name in REFERENCE_NAMES for outcome in ('hits', 'misses')]
+    values = cache.get_many(keys)
+    return {
+        name: {
+            outcome: values.get(_stats_key(name, outcome), 0)
+            for outcome in ('hits', 'misses')
+        }
+        for name in REFERENCE_NAMES
+    }
+
+
+def reset_stats():
+    with _stats_lock:
+        _pending_stats.clear()
+    cache.delete_many([
+        _stats_key(name, outcome) for name in REFERENCE_NAMES for outcome in ('hits', 'misses')
+    ])
+
+
+def get_version(name):
+    """Ma'lumotnoma versiyasi — har bir invalidate() da almashadi."""
+    return cache.get_or_set(_version_key(name), lambda: timezone.now().timestamp(), None)
+
+
+def _read_through(name, loader):
+    key = f'ref:{name}:{get_version(name)}'
+    value = cache.get(key, _missing)
+    if value is _missing:
+        _record(name, 'misses')
+        value = loader()
+        cache.set(key, value, settings.REFERENCE_CACHE_TIMEOUT)
+    else:
+        _record(name, 'hits')
+    return value
+
+
+def invalidate(name):
+    """Versiyani almashtirish; eski yozuvlar o'z vaqtida o'chib ketadi."""
+    cache.set(_version_key(name), timezone.now().timestamp(), None)
+
+
+def get_site_settings():
+    return _read_through('site_settings', SiteSetting.get_settings)
+
+
+def get_laboratories():
+    """Faol laboratoriyalar ro'yxati."""
+    return _read_through('laboratories', lambda: list(Laboratory.objects.filter(is_active=True)))
+
+
+def get_partners():
+    """Faol hamkorlar ro'yxati."""
+    return _read_through('partners', lambda: list(Partner.objects.filter(is_active=True)))
+
+
+# ==================== PENDING APPLICATIONS ====================
+
+def get_pending_count():
+    """Kutilayotgan arizalar soni; kesh bo'sh bo'lsagina bazadan sanaladi."""
+    count = cache.get(PENDING_COUNT_KEY)
+    if count is None:
+        count = Application.objects.filter(status='pending').count()
+        cache.set(PENDING_COUNT_KEY, count, settings.PENDING_COUNT_TIMEOUT)
+    return count
+
+
+def invalidate_pending_count():
+    """Hisoblagichni o'chirish; keyingi get_pending_count() bazadan qayta sanaydi."""
+    cache.delete(PENDING_COUNT_KEY)
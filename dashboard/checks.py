@@ -0,0 +1,20 @@
+from django.core.checks import Error, Tags, register
+
+from .search import missing_search_triggers
+
+
+@register(Tags.database)
+def search_triggers_check(app_configs, databases=None, **kwargs):
+    """Qidiruv indeksi triggerlari joyida (jadval qayta qurilganda o'chib ketadi)."""
+    if not databases or 'default' not in databases:
+        return []
+    missing = missing_search_triggers('default')
+    if not missing:
+        return []
+    return [
+        Error(
+            f"Qidiruv indeksi triggerlari yo'q: {', '.join(missing)}. Qidiruv natijalari eskirib boradi.",
+            hint="Jadval qayta qurilgan (AlterField va h.k.). `manage.py rebuild_search_index` ni ishga tushiring.",
+            id='dashboard.E001',
+        )
+    ]
@@ -0,0 +1,200 @@
+import gzip
+import hashlib
+import random
+import re
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import cc_delim_re, patch_vary_headers
+from django.utils.crypto import get_random_string
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bo'shliqlar faqat teglar orasidagi matnda qisqartiriladi. Ajratiladigan bo'laklar:
+# ichidagi bo'shliqlar ma'noli bo'lgan bloklar, izohlar va teglarning o'zi
+# (atribut qiymatlari ichida '>' bo'lishi mumkin) — ularning hech biriga tegilmaydi.
+TOKEN_RE = re.compile(
+    r'''(<(pre|code|textarea|script|style)\b.*?</\2\s*>|<!--.*?-->|<[a-zA-Z/!](?:"[^"]*"|'[^']*'|[^'">])*>)''',
+    re.I | re.S,
+)
+NEWLINE_SPACE_RE = re.compile(r'\s*\n\s*')
+SPACE_RE = re.compile(r'[ \t\r\f\v]{2,}')
+COMPRESSIBLE_TYPES = ('text/', 'application/json', 'application/javascript', 'image/svg+xml')
+MIN_LENGTH = 200
+# BREACH: siqilgan javob uzunligi har safar tasodifiy o'zgaradi (django GZipMiddleware kabi)
+MAX_RANDOM_BYTES = 100
+PADDING_CHARS = ' \t\n\r'
+
+STATS_FIELDS = ('responses', 'original', 'minified', 'sent', 'cache_hits')
+STATS_FLUSH_EVERY = 50
+
+_pending_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def minify_html(html):
+    """
+    Izohlar olib tashlanadi, teglar orasidagi bo'shliqlar bittaga qisqartiriladi.
+    Teg ichi (atributlar) hamda <pre>, <code>, <textarea>, <script> va <style> ichiga tegilmaydi.
+    """
+    parts = TOKEN_RE.split(html)
+    result = []
+    # split() guruhlari: [matn, bo'lak, teg nomi, matn, bo'lak, teg nomi, ...]
+    for index in range(0, len(parts), 3):
+        text = NEWLINE_SPACE_RE.sub('\n', parts[index])
+        result.append(SPACE_RE.sub(' ', text))
+        if index + 1 < len(parts):
+            token = parts[index + 1]
+            if not (token.startswith('<!--') and not token.startswith('<!--[if')):
+                result.append(token)
+    return ''.join(result)
+
+
+def parse_accept_encoding(accept_encoding):
+    """Accept-Encoding sarlavhasi -> {kodlash: q}. Noto'g'ri q qiymati 0 deb olinadi."""
+    weights = {}
+    for part in accept_encoding.lower().split(','):
+        name, *params = [item.strip() for item in part.split(';')]
+        if not name:
+            continue
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition('=')
+            if key.strip() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name] = q
+    return weights
+
+
+def choose_encoding(accept_encoding, available=None):
+    """
+    Mijoz qabul qiladigan (q > 0) kodlashlardan q eng kattasi; tengida available tartibi.
+    Ro'yxatda yo'q kodlash uchun '*' qiymati olinadi.
+    """
+    if available is None:
+        available = ('br', 'gzip') if brotli is not None else ('gzip',)
+    weights = parse_accept_encoding(accept_encoding)
+    chosen, best = None, 0.0
+    for name in available:
+        q = weights.get(name, weights.get('*', 0.0))
+        if q > best:
+            chosen, best = name, q
+    return chosen
+
+
+def compress(content, encoding):
+    """
+    Siqilgan tana uzunligiga tasodifiy 0..MAX_RANDOM_BYTES bayt qo'shiladi (BREACH).
+    gzip'da django.utils.text.compress_string kabi sarlavhadagi fayl nomi maydoniga;
+    brotli'da bunday maydon yo'q, shuning uchun tana oxiriga tasodifiy bo'shliq belgilar.
+    """
+    if encoding == 'br':
+        # 4 xil belgi ~2 bit/belgi siqiladi: 4*N bo'shliq ~N bayt beradi
+        padding = get_random_string(4 * random.randint(0, MAX_RANDOM_BYTES), PADDING_CHARS).encode()
+        return brotli.compress(content + padding, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    compressed = gzip.compress(content, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+    filename = get_random_string(random.randint(1, MAX_RANDOM_BYTES)).encode()
+    header = bytearray(compressed[:10])
+    header[3] = gzip.FNAME
+    return bytes(header) + filename + b'\x00' + compressed[10:]
+
+
+def no_transform(response):
+    directives = cc_delim_re.split(response.get('Cache-Control', ''))
+    return any(directive.strip().lower() == 'no-transform' for directive in directives)
+
+
+def _stats_key(field):
+    return f'compression:stats:{field}'
+
+
+def _record(**values):
+    with _stats_lock:
+        _pending_stats.update(values)
+        if _pending_stats['responses'] < STATS_FLUSH_EVERY:
+            return
+        flushed = dict(_pending_stats)
+        _pending_stats.clear()
+    for field, delta in flushed.items():
+        key = _stats_key(field)
+        cache.set(key, cache.get(key, 0) + delta, None)
+
+
+def get_stats():
+    values = cache.get_many([_stats_key(field) for field in STATS_FIELDS])
+    return {field: values.get(_stats_key(field), 0) for field in STATS_FIELDS}
+
+
+def reset_stats():
+    with _stats_lock:
+        _pending_stats.clear()
+    cache.delete_many([_stats_key(field) for field in STATS_FIELDS])
+
+
+class CompressionMiddleware:
+    """
+    HTML javoblarni minifikatsiya qilish va br/gzip bilan siqish.
+    Javob sahifa keshidan kelgan bo'lsa (response.page_cached), siqilgan tana ham
+    tarkib xeshi bo'yicha keshdan olinadi — har bir hitda qayta siqilmaydi.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        content_type = response.get('Content-Type', '')
+        if (
+            response.streaming
+            or response.status_code != 200
+            or response.has_header('Content-Encoding')
+            or not content_type.startswith(COMPRESSIBLE_TYPES)
+            or len(response.content) < MIN_LENGTH
+            # Kesh/proksi tanani o'zgartirmasin deb so'ralgan — minifikatsiya ham, siqish ham yo'q
+            or no_transform(response)
+        ):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = choose_encoding(request.headers.get('Accept-Encoding', ''))
+        original = response.content
+        is_html = content_type.startswith('text/html')
+
+        cache_key = None
+        if getattr(response, 'page_cached', False):
+            digest = hashlib.blake2b(original, digest_size=16).hexdigest()
+            cache_key = f'compression:body:{encoding or "identity"}:{digest}'
+            cached = cache.get(cache_key)
+            if cached is not None:
+                minified_length, body, encoding = cached
+                self.finish(response, body, encoding)
+                _record(responses=1, original=len(original), minified=minified_length, sent=len(body), cache_hits=1)
+                return response
+
+        minified = minify_html(original.decode(response.charset)).encode(response.charset) if is_html else original
+        body = compress(minified, encoding) if encoding else minified
+        if encoding and len(body) >= len(minified):
+            encoding, body = None, minified
+        if cache_key is not None:
+            cache.set(cache_key, (len(minified), body, encoding), settings.COMPRESSION_CACHE_TIMEOUT)
+        self.finish(response, body, encoding)
+        _record(responses=1, original=len(original), minified=len(minified), sent=len(body))
+        return response
+
+    def finish(self, response, body, encoding):
+        response.content = body
+        response['Content-Length'] = str(len(body))
+        if encoding:
+            response['Content-Encoding'] = encoding
+            # Siqilgan tana baytma-bayt boshqa — kuchli ETag zaiflashtiriladi
+            etag = response.get('ETag')
+            if etag and etag.startswith('"'):
+                response['ETag'] = 'W/' + etag
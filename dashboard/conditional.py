@@ -0,0 +1,34 @@
+import hashlib
+
+from django.contrib.messages import get_messages
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.utils.translation import get_language
+
+from .cache import IMAGES_VERSION, get_version
+
+
+def _user_key(request):
+    user = request.user
+    if not user.is_authenticated:
+        return 'anonymous'
+    # Sahifa sarlavhasidagi ism, email va avatar o'zgarsa ham ETag o'zgaradi
+    return (user.pk, user.get_full_name(), user.email, user.avatar.name if user.avatar else '')
+
+
+def make_etag(request, *parts, per_user=True):
+    """
+    Sahifa ETag'i: berilgan qiymatlar + til, sayt sozlamalari, rasm variantlari
+    versiyasi, static manifest (deploydan keyin eski CSS nomlariga ishora qiluvchi
+    sahifa qaytmasligi uchun) va foydalanuvchi. Ko'rsatilmagan flash xabarlar bo'lsa None — sahifa to'liq chiziladi.
+    """
+    if per_user and len(get_messages(request)):
+        return None
+    key = repr((
+        parts,
+        get_language(),
+        get_version('site_settings'),
+        get_version(IMAGES_VERSION),
+        getattr(staticfiles_storage, 'manifest_hash', ''),
+        _user_key(request) if per_user else None,
+    ))
+    return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
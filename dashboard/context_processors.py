@@ -1,11 +1,17 @@
-from dashboard.models import Application
+from django.utils.functional import SimpleLazyObject
+
+from dashboard.cache import get_pending_count, get_site_settings
 
 
 def pending_applications(request):
-    if request.user.is_authenticated:
+    # Nishon faqat admin panelida ko'rinadi, talabalar uchun hisoblanmaydi
+    if request.user.is_authenticated and request.user.is_admin_user:
         try:
-            count = Application.objects.filter(status='pending').count()
-            return {'pending_count': count}
+            return {'pending_count': get_pending_count()}
         except Exception:
             return {'pending_count': 0}
     return {'pending_count': 0}
+
+
+def site_settings(request):
+    return {'site': SimpleLazyObject(get_site_settings)}
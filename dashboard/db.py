@@ -0,0 +1,104 @@
+from contextvars import ContextVar
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+
+READ_ALIAS = 'replica'
+WRITE_ALIAS = 'default'
+PIN_COOKIE = 'db_primary'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+_routing = ContextVar('dashboard_db_routing', default=None)
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    """Har bir yangi SQLite ulanishiga settings.SQLITE_PRAGMAS qiymatlarini qo'llash."""
+    if connection.vendor != 'sqlite':
+        return
+    read_only = connection.alias == READ_ALIAS
+    with connection.cursor() as cursor:
+        for name, value in settings.SQLITE_PRAGMAS.items():
+            # Jurnal rejimini faqat yozuvchi ulanish o'zgartira oladi
+            if read_only and name == 'journal_mode':
+                continue
+            cursor.execute(f'PRAGMA {name} = {value}')
+        if read_only:
+            cursor.execute('PRAGMA query_only = 1')
+
+
+class _RoutingState:
+    def __init__(self, use_replica):
+        self.use_replica = use_replica
+        # Faqat tasdiqlangan (commit) yozuvdan keyin — pin cookie shunga qarab qo'yiladi
+        self.wrote = False
+
+
+class ReadReplicaRouter:
+    """
+    Xavfsiz (GET/HEAD/OPTIONS) so'rovlardagi o'qishlar faqat o'qish uchun
+    ulanishga yuboriladi. Asosiy baza kerak bo'lgach (get_or_create, save va h.k.),
+    so'rovning qolgan qismi ham asosiy bazada.
+    So'rovdan tashqarida (buyruqlar, migratsiyalar) hamma narsa asosiy bazada.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _routing.get()
+        if state is not None and state.use_replica:
+            return READ_ALIAS
+        return WRITE_ALIAS
+
+    def db_for_write(self, model, **hints):
+        # db_for_write yozuvsiz ham chaqiriladi (get_or_create topganda, select_for_update) —
+        # bu yerda faqat so'rov ichidagi o'qishlar ko'chiriladi, pin cookie emas
+        state = _routing.get()
+        if state is not None:
+            state.use_replica = False
+        return WRITE_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == WRITE_ALIAS
+
+
+def mark_written(sender, using=WRITE_ALIAS, **kwargs):
+    """
+    post_save/post_delete: so'rov ichidagi yozuv tranzaksiya tasdiqlangandan keyin belgilanadi.
+    Orqaga qaytarilgan yozuv foydalanuvchini asosiy bazaga bog'lamaydi.
+    """
+    state = _routing.get()
+    if state is not None and not state.wrote:
+        transaction.on_commit(partial(setattr, state, 'wrote', True), using=using)
+
+
+class DatabaseRoutingMiddleware:
+    """
+    Yozuvdan keyingi so'rovlar ham (masalan, POST -> redirect -> GET)
+    DATABASE_PIN_SECONDS davomida asosiy bazaga bog'lanadi.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        use_replica = (
+            READ_ALIAS in settings.DATABASES
+            and request.method in SAFE_METHODS
+            and PIN_COOKIE not in request.COOKIES
+        )
+        state = _RoutingState(use_replica)
+        token = _routing.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _routing.reset(token)
+        if request.method not in SAFE_METHODS or state.wrote:
+            response.set_cookie(
+                PIN_COOKIE, '1',
+                max_age=settings.DATABASE_PIN_SECONDS,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
@@ -0,0 +1,92 @@
+import mimetypes
+import os
+import posixpath
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils.http import content_disposition_header
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class _ByteRange:
+    """Fayl ichidagi [start, start + length) bo'lagini o'qiydigan o'rama (FileResponse uchun)."""
+
+    def __init__(self, fh, start, length):
+        fh.seek(start)
+        self.fh = fh
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.fh.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.fh.close()
+
+
+def parse_range(header, size):
+    # Faqat bitta oraliq qo'llanadi; bir nechta oraliq so'ralsa butun fayl qaytariladi
+    match = RANGE_RE.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        start = max(size - int(last), 0)
+        end = size - 1
+    if start > end:
+        raise ValueError
+    return start, end
+
+
+def protected_file_response(request, storage, name, filename=None):
+    """
+    Ruxsat tekshirilgandan keyin faylni yuborish. PROTECTED_MEDIA_SERVER sozlangan bo'lsa
+    baytlarni veb-server yuboradi (nginx X-Accel-Redirect yoki Apache X-Sendfile) —
+    Python faqat sarlavha qaytaradi. Aks holda FileResponse (Range so'rovlari bilan).
+    """
+    filename = filename or posixpath.basename(name)
+    disposition = content_disposition_header(False, filename)
+    content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    server = settings.PROTECTED_MEDIA_SERVER
+
+    if server == 'nginx':
+        response = HttpResponse(content_type=content_type)
+        response['X-Accel-Redirect'] = quote(settings.PROTECTED_MEDIA_INTERNAL_URL + name)
+    elif server == 'sendfile':
+        response = HttpResponse(content_type=content_type)
+        response['X-Sendfile'] = storage.path(name)
+    else:
+        try:
+            fh = storage.open(name, 'rb')
+        except FileNotFoundError:
+            # Yozuv bor, lekin fayl diskda yo'q — 500 o'rniga 404
+            raise Http404
+        size = os.fstat(fh.fileno()).st_size
+        try:
+            byte_range = parse_range(request.headers.get('Range', ''), size)
+        except ValueError:
+            fh.close()
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+        if byte_range is None:
+            response = FileResponse(fh, content_type=content_type)
+        else:
+            start, end = byte_range
+            response = FileResponse(_ByteRange(fh, start, end - start + 1), status=206, content_type=content_type)
+            response['Content-Length'] = end - start + 1
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Accept-Ranges'] = 'bytes'
+
+    response['Content-Disposition'] = disposition
+    response['Cache-Control'] = 'private, max-age=0'
+    return response
@@ -0,0 +1,189 @@
+import json
+import logging
+import posixpath
+from io import BytesIO
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.db import models
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from .cache import IMAGES_VERSION, invalidate as invalidate_version
+
+logger = logging.getLogger(__name__)
+
+VARIANTS_DIR = 'variants'
+# Variant nomlari asl fayl nomidan hisoblanadi, shuning uchun ular tarkib xeshi bilan
+# nomlovchi standart saqlagichga emas, oddiy fayl saqlagichiga yoziladi
+variant_storage = FileSystemStorage()
+ORIGINAL_FORMATS = {
+    'JPEG': {'quality': 85, 'optimize': True, 'progressive': True},
+    'PNG': {'optimize': True},
+    'WEBP': {'quality': 85},
+}
+VARIANT_FORMATS = {
+    'webp': {'format': 'WEBP', 'quality': 80, 'method': 4},
+    'jpg': {'format': 'JPEG', 'quality': 80, 'optimize': True, 'progressive': True},
+}
+
+
+def file_fields(field_class=models.FileField):
+    """Loyihadagi barcha (model, FileField) juftliklari; ImageField ham FileField."""
+    for model in apps.get_models():
+        for field in model._meta.get_fields():
+            if isinstance(field, field_class):
+                yield model, field
+
+
+def image_fields():
+    """Loyihadagi barcha (model, ImageField) juftliklari."""
+    return file_fields(models.ImageField)
+
+
+def variant_base(name):
+    root, ext = posixpath.splitext(name)
+    return posixpath.join(VARIANTS_DIR, root)
+
+
+def variant_name(name, width, ext):
+    return posixpath.join(variant_base(name), f'{width}.{ext}')
+
+
+def _manifest_name(name):
+    return posixpath.join(variant_base(name), 'manifest.json')
+
+
+def _manifest_key(name):
+    return f'image_variants:{name}'
+
+
+def get_manifest(name):
+    """
+    {'width', 'height', 'widths'} yoki variantlar hali tayyor bo'lmasa None.
+    Sahifa render qilinganda diskka murojaat qilmaslik uchun keshlanadi.
+    """
+    key = _manifest_key(name)
+    manifest = cache.get(key)
+    if manifest is None:
+        try:
+            with variant_storage.open(_manifest_name(name)) as fh:
+                manifest = json.load(fh)
+            timeout = None
+        except (OSError, ValueError):
+            manifest, timeout = {}, 60
+        cache.set(key, manifest, timeout)
+    return manifest or None
+
+
+def has_variants(name):
+    return variant_storage.exists(_manifest_name(name))
+
+
+def _encode(image, ext):
+    options = dict(VARIANT_FORMATS[ext])
+    if options['format'] == 'JPEG' and image.mode != 'RGB':
+        # JPEG shaffoflikni qo'llamaydi — oq fon ustiga yotqiziladi
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A') if 'A' in image.getbands() else None)
+        image = background
+    buffer = BytesIO()
+    image.save(buffer, **options)
+    return buffer.getvalue()
+
+
+def generate_variants(name):
+    """
+    Asl rasmdan IMAGE_VARIANT_WIDTHS kengliklaridagi WebP va JPEG nusxalarini yaratish.
+    EXIF ma'lumotlari nusxalarga o'tkazilmaydi. Rasm bo'lmagan fayllar o'tkazib yuboriladi.
+    Sahifa keshlari uchun chaqiruvchi paket oxirida variants_changed() ni chaqiradi.
+    """
+    try:
+        with default_storage.open(name) as fh:
+            original = Image.open(fh)
+            original = ImageOps.exif_transpose(original)
+            original.load()
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+        logger.warning("Rasm variantlarini yaratib bo'lmadi: %s", name)
+        return None
+
+    if original.mode not in ('RGB', 'RGBA'):
+        original = original.convert('RGBA' if 'transparency' in original.info else 'RGB')
+
+    width, height = original.size
+    widths = [w for w in settings.IMAGE_VARIANT_WIDTHS if w < width] or [width]
+    for target in widths:
+        resized = original.resize((target, max(1, round(height * target / width))), Image.LANCZOS)
+        for ext in VARIANT_FORMATS:
+            path = variant_name(name, target, ext)
+            if variant_storage.exists(path):
+                variant_storage.delete(path)
+            variant_storage.save(path, ContentFile(_encode(resized, ext)))
+
+    manifest = {'width': width, 'height': height, 'widths': widths}
+    manifest_path = _manifest_name(name)
+    if variant_storage.exists(manifest_path):
+        variant_storage.delete(manifest_path)
+    variant_storage.save(manifest_path, ContentFile(json.dumps(manifest).encode()))
+    cache.set(_manifest_key(name), manifest, None)
+    return manifest
+
+
+def variants_changed():
+    """
+    Keshdagi sahifalar va ETag'lar oddiy <img> bilan qolib ketmasligi uchun.
+    Har bir rasmda emas, paket (buyruq, navbat partiyasi) oxirida bir marta chaqiriladi.
+    """
+    invalidate_version(IMAGES_VERSION)
+
+
+def optimize_original(name):
+    """
+    Asl faylni IMAGE_MAX_DIMENSION gacha kichraytirish va EXIF (GPS va h.k.) ni olib tashlash.
+    Natija yangi fayl sifatida saqlanadi va uning nomi qaytariladi; o'zgartirish kerak
+    bo'lmasa None. Eski faylni process_image havolalar ko'chirilgandan keyin o'chiradi.
+    """
+    with default_storage.open(name) as fh:
+        try:
+            image = Image.open(fh)
+        except UnidentifiedImageError:
+            return None
+        image_format = image.format
+        too_large = max(image.size) > settings.IMAGE_MAX_DIMENSION
+        if image_format not in ORIGINAL_FORMATS or not (too_large or image.getexif()):
+            return None
+        image = ImageOps.exif_transpose(image)
+        image.load()
+
+    limit = settings.IMAGE_MAX_DIMENSION
+    image.thumbnail((limit, limit), Image.LANCZOS)
+    if image_format == 'JPEG' and image.mode != 'RGB':
+        image = image.convert('RGB')
+    buffer = BytesIO()
+    image.save(buffer, format=image_format, **ORIGINAL_FORMATS[image_format])
+
+    return default_storage.save(name, ContentFile(buffer.getvalue()))
+
+
+def replace_references(old, new):
+    """Eski fayl nomini ishlatayotgan barcha rasm maydonlarini yangi nomga o'tkazish."""
+    for model, field in image_fields():
+        # save() orqali — keshlarni tozalovchi signallar ishlashi uchun
+        for obj in model._default_manager.filter(**{field.name: old}):
+            setattr(obj, field.attname, new)
+            obj.save(update_fields=[field.attname])
+
+
+def process_image(name):
+    """Fon jarayonida bajariladigan to'liq ishlov: asl faylni optimallashtirish va variantlar."""
+    optimized = optimize_original(name)
+    if optimized is None or optimized == name:
+        return generate_variants(name)
+    manifest = generate_variants(optimized)
+    replace_references(name, optimized)
+    # EXIF/GPS bor asl nusxa eski URL orqali ochiq qolmasligi kerak. Barcha yozuvlar
+    # yangi nomga o'tdi; blob nusxasini gc_media_blobs keyin tozalaydi
+    default_storage.delete(name)
+    return manifest
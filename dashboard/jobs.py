@@ -0,0 +1,78 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import ImageField
+from django.utils import timezone
+
+from .models import ImageJob
+
+
+def enqueue_image(name):
+    """Rasmni fon ishloviga navbatga qo'yish (bir fayl uchun bitta vazifa)."""
+    ImageJob.objects.update_or_create(
+        name=name,
+        defaults={'status': 'pending', 'attempts': 0, 'last_error': '', 'run_after': timezone.now()},
+    )
+
+
+def claim_image_jobs(limit):
+    """Bajarish vaqti kelgan vazifalarni 'processing' holatiga o'tkazib olish."""
+    with transaction.atomic():
+        jobs = list(
+            ImageJob.objects.filter(status='pending', run_after__lte=timezone.now())
+            .order_by('run_after')[:limit]
+        )
+        ImageJob.objects.filter(pk__in=[job.pk for job in jobs]).update(
+            status='processing', updated_at=timezone.now(),
+        )
+    return jobs
+
+
+def complete_image_job(job, manifest):
+    # Rasm sifatida o'qib bo'lmaydigan fayllar qayta urinilmaydi
+    if manifest is None:
+        job.status = 'failed'
+        job.last_error = "Faylni rasm sifatida o'qib bo'lmadi"
+    else:
+        job.status = 'done'
+        job.last_error = ''
+    job.attempts += 1
+    job.save(update_fields=['status', 'attempts', 'last_error', 'updated_at'])
+
+
+def retry_image_job(job, error):
+    job.attempts += 1
+    job.last_error = str(error)
+    if job.attempts >= settings.IMAGE_JOB_MAX_ATTEMPTS:
+        job.status = 'failed'
+    else:
+        job.status = 'pending'
+        job.run_after = timezone.now() + timedelta(seconds=30 * 2 ** job.attempts)
+    job.save(update_fields=['status', 'attempts', 'last_error', 'run_after', 'updated_at'])
+
+
+def release_stale_jobs():
+    """
+    Worker to'xtab qolganda 'processing' holatida qolgan vazifalarni navbatga qaytarish.
+    Faqat IMAGE_JOB_STALE_SECONDS dan beri o'zgarmaganlari — boshqa ishlayotgan
+    worker olgan vazifa ikkinchi marta bajarilmaydi.
+    """
+    threshold = timezone.now() - timedelta(seconds=settings.IMAGE_JOB_STALE_SECONDS)
+    return ImageJob.objects.filter(status='processing', updated_at__lt=threshold).update(status='pending')
+
+
+def image_jobs_for(obj):
+    """Obyekt rasm maydonlariga tegishli vazifalar (tahrirlash sahifasida holatini ko'rsatish uchun)."""
+    names = [
+        getattr(obj, field.attname).name
+        for field in obj._meta.fields
+        if isinstance(field, ImageField) and getattr(obj, field.attname)
+    ]
+    if not names:
+        return []
+    return list(ImageJob.objects.filter(name__in=names))
+
+
+def job_statuses(names):
+    return dict(ImageJob.objects.filter(name__in=names).values_list('name', 'status'))
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from dashboard.images import generate_variants, has_variants, image_fields, variants_changed
+
+
+class Command(BaseCommand):
+    help = "Mavjud barcha rasmlar uchun WebP/JPEG o'lcham variantlarini yaratish"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help="Mavjud variantlarni ham qayta yaratish")
+
+    def handle(self, *args, **options):
+        built = skipped = failed = 0
+        for model, field in image_fields():
+            names = (
+                model._default_manager.exclude(**{f'{field.name}__isnull': True})
+                .exclude(**{field.name: ''})
+                .values_list(field.name, flat=True)
+                .distinct()
+            )
+            for name in names.iterator():
+                if not options['force'] and has_variants(name):
+                    skipped += 1
+                elif generate_variants(name) is None:
+                    failed += 1
+                else:
+                    built += 1
+                    self.stdout.write(f"  {model._meta.label}.{field.name}: {name}")
+        if built:
+            variants_changed()
+        self.stdout.write(self.style.SUCCESS(
+            f"Yaratildi: {built}, o'tkazib yuborildi: {skipped}, xato: {failed}"
+        ))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from dashboard import cache as reference_cache
+
+
+class Command(BaseCommand):
+    help = "Ma'lumotnoma keshi (sozlamalar, laboratoriyalar, hamkorlar) bo'yicha hit/miss statistikasi"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help="Statistikani nolga tushirish")
+
+    def handle(self, *args, **options):
+        if options['reset']:
+            reference_cache.reset_stats()
+            self.stdout.write(self.style.SUCCESS("Statistika tozalandi."))
+            return
+
+        stats = reference_cache.get_stats()
+        self.stdout.write(f"{'Nomi':<16}{'Hit':>10}{'Miss':>10}{'Hit %':>10}")
+        for name, counts in stats.items():
+            total = counts['hits'] + counts['misses']
+            ratio = f"{counts['hits'] * 100 / total:.1f}" if total else '-'
+            self.stdout.write(f"{name:<16}{counts['hits']:>10}{counts['misses']:>10}{ratio:>10}")
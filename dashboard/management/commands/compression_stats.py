@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from dashboard import compression
+
+
+class Command(BaseCommand):
+    help = "HTML minifikatsiya va siqish natijasida tejalgan baytlar hisoboti"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help="Statistikani nolga tushirish")
+
+    def handle(self, *args, **options):
+        if options['reset']:
+            compression.reset_stats()
+            self.stdout.write(self.style.SUCCESS("Statistika tozalandi."))
+            return
+
+        stats = compression.get_stats()
+        original = stats['original']
+        self.stdout.write(f"{'Javoblar:':<24}{stats['responses']} (keshdan: {stats['cache_hits']})")
+        self.stdout.write(f"{'Asl hajm:':<24}{original / 1024:.1f} KB")
+        for label, field in (("Minifikatsiyadan keyin", 'minified'), ("Yuborilgan", 'sent')):
+            saved = original - stats[field]
+            ratio = f"{saved * 100 / original:.1f}%" if original else '-'
+            self.stdout.write(f"{label + ':':<24}{stats[field] / 1024:.1f} KB (tejaldi {ratio})")
@@ -0,0 +1,74 @@
+import os
+import time
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+
+from dashboard.storage import ContentAddressedStorage, file_digest, scan_files
+
+
+class Command(BaseCommand):
+    help = (
+        "Hech bir media fayl havola qilmayotgan bloblarni o'chirish. "
+        "--adopt mavjud media fayllarni blob omboriga ko'chirib, takrorlarini birlashtiradi."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--adopt', action='store_true', help="Mavjud fayllarni blob omboriga qo'shish")
+        parser.add_argument('--dry-run', action='store_true', help="Hech narsani o'zgartirmasdan hisobot berish")
+        parser.add_argument(
+            '--min-age', type=int, default=60,
+            help="Shundan yosh (daqiqa) bloblar o'chirilmaydi — yuklanayotgan fayllar uchun",
+        )
+
+    def handle(self, *args, **options):
+        if not isinstance(default_storage, ContentAddressedStorage):
+            raise CommandError("Standart saqlagich ContentAddressedStorage emas")
+        if options['adopt']:
+            self.adopt(options['dry_run'])
+        self.collect(options['dry_run'], options['min_age'] * 60)
+
+    def adopt(self, dry_run):
+        adopted = merged = saved = 0
+        for entry in scan_files(settings.MEDIA_ROOT):
+            stat = entry.stat(follow_symlinks=False)
+            if stat.st_nlink > 1:
+                continue
+            with open(entry.path, 'rb') as fh:
+                blob = default_storage.blob_path(file_digest(fh))
+            if os.path.exists(blob):
+                # Takror: faylni mavjud blobga havola bilan almashtirish
+                merged += 1
+                saved += stat.st_size
+                if not dry_run:
+                    tmp_path = entry.path + '.link'
+                    os.link(blob, tmp_path)
+                    os.replace(tmp_path, entry.path)
+            else:
+                adopted += 1
+                if not dry_run:
+                    os.makedirs(os.path.dirname(blob), exist_ok=True)
+                    os.link(entry.path, blob)
+        self.stdout.write(
+            f"Omborga qo'shildi: {adopted}, birlashtirildi: {merged} ({saved / 1024 / 1024:.1f} MB)"
+        )
+
+    def collect(self, dry_run, min_age):
+        removed = freed = 0
+        cutoff = time.time() - min_age
+        for entry in scan_files(default_storage.blob_location):
+            stat = entry.stat(follow_symlinks=False)
+            # Faqat ombordagi havola qolgan — hech bir media fayl uni ishlatmaydi
+            if stat.st_nlink > 1 or stat.st_mtime > cutoff:
+                continue
+            removed += 1
+            freed += stat.st_size
+            if dry_run:
+                self.stdout.write(f"  {entry.path}")
+            else:
+                os.remove(entry.path)
+        verb = "O'chiriladi" if dry_run else "O'chirildi"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb}: {removed} blob ({freed / 1024 / 1024:.1f} MB)"
+        ))
@@ -0,0 +1,51 @@
+import logging
+import time
+from concurrent.futures import as_completed
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from dashboard.images import process_image, variants_changed
+from dashboard.jobs import claim_image_jobs, complete_image_job, release_stale_jobs, retry_image_job
+from dashboard.workers import worker_pool
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Rasm vazifalari navbatini jarayonlar puli orqali bajaruvchi worker"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=settings.IMAGE_WORKERS, help="Jarayonlar soni")
+        parser.add_argument('--batch', type=int, default=20, help="Bir marta olinadigan vazifalar soni")
+        parser.add_argument('--once', action='store_true', help="Navbat bo'shagach to'xtash")
+
+    def handle(self, *args, **options):
+        released = release_stale_jobs()
+        if released:
+            self.stdout.write(f"Navbatga qaytarildi: {released}")
+
+        with worker_pool(options['workers']) as pool:
+            while True:
+                jobs = claim_image_jobs(options['batch'])
+                if not jobs:
+                    if options['once']:
+                        break
+                    time.sleep(settings.IMAGE_JOB_POLL_SECONDS)
+                    continue
+
+                futures = {pool.submit(process_image, job.name): job for job in jobs}
+                built = False
+                for future in as_completed(futures):
+                    job = futures[future]
+                    try:
+                        manifest = future.result()
+                    except Exception as exc:
+                        logger.exception("Rasm vazifasi bajarilmadi: %s", job.name)
+                        retry_image_job(job, exc)
+                    else:
+                        complete_image_job(job, manifest)
+                        built = built or manifest is not None
+                        self.stdout.write(f"  {job.get_status_display()}: {job.name}")
+                if built:
+                    variants_changed()
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from dashboard.search import missing_search_triggers, rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Qidiruv indeksi (FTS5) triggerlarini qayta yaratish va indeksni to'liq qayta to'ldirish. "
+        "Indekslangan jadvalni qayta quradigan har bir migratsiyadan keyin ishga tushiriladi."
+    )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError("Qidiruv indeksi faqat SQLite uchun")
+        missing = missing_search_triggers()
+        if missing:
+            self.stdout.write(f"Yo'qolgan triggerlar: {', '.join(missing)}")
+        rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS("Qidiruv indeksi qayta qurildi"))
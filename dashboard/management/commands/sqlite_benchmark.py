@@ -0,0 +1,96 @@
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+SEED_ROWS = 10000
+
+
+class Command(BaseCommand):
+    help = (
+        "Vaqtinchalik bazada standart va sozlangan (SQLITE_PRAGMAS + BEGIN IMMEDIATE) "
+        "SQLite rejimlarida parallel o'qish/yozish tezligini solishtirish"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seconds', type=float, default=5, help="Har bir rejim davomiyligi")
+        parser.add_argument('--readers', type=int, default=4, help="O'quvchi oqimlar soni")
+        parser.add_argument('--writers', type=int, default=2, help="Yozuvchi oqimlar soni")
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rejim'.ljust(10) + "O'qish/s".rjust(12) + 'Yozish/s'.rjust(12) + 'Qulf xatosi'.rjust(14))
+        with tempfile.TemporaryDirectory() as tmp:
+            for mode in ('default', 'tuned'):
+                path = Path(tmp) / f'{mode}.sqlite3'
+                reads, writes, errors = self.run_mode(path, mode, options)
+                seconds = options['seconds']
+                self.stdout.write(f"{mode:<10}{reads / seconds:>12.0f}{writes / seconds:>12.0f}{errors:>14}")
+
+    def connect(self, path, mode):
+        conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        if mode == 'tuned':
+            for name, value in settings.SQLITE_PRAGMAS.items():
+                conn.execute(f'PRAGMA {name} = {value}')
+        return conn
+
+    def run_mode(self, path, mode, options):
+        conn = self.connect(path, mode)
+        conn.execute('CREATE TABLE item (id INTEGER PRIMARY KEY, status TEXT, payload TEXT)')
+        conn.execute('BEGIN')
+        conn.executemany(
+            'INSERT INTO item (status, payload) VALUES (?, ?)',
+            (('pending', 'x' * 200) for _ in range(SEED_ROWS)),
+        )
+        conn.execute('COMMIT')
+        conn.close()
+
+        begin = 'BEGIN IMMEDIATE' if mode == 'tuned' else 'BEGIN'
+        counters = {'reads': 0, 'writes': 0, 'errors': 0}
+        lock = threading.Lock()
+        deadline = time.monotonic() + options['seconds']
+
+        def count(key):
+            with lock:
+                counters[key] += 1
+
+        def reader():
+            db = self.connect(path, mode)
+            while time.monotonic() < deadline:
+                try:
+                    db.execute(
+                        'SELECT count(*) FROM item WHERE id > ? AND status = ?',
+                        (random.randint(1, SEED_ROWS), 'pending'),
+                    ).fetchone()
+                    count('reads')
+                except sqlite3.OperationalError:
+                    count('errors')
+            db.close()
+
+        def writer():
+            # Ilovadagi kabi: avval tekshirish, keyin yozish (exists() + save())
+            db = self.connect(path, mode)
+            while time.monotonic() < deadline:
+                try:
+                    db.execute(begin)
+                    db.execute('SELECT id FROM item WHERE id = ?', (random.randint(1, SEED_ROWS),)).fetchone()
+                    db.execute('INSERT INTO item (status, payload) VALUES (?, ?)', ('pending', 'y' * 200))
+                    db.execute('COMMIT')
+                    count('writes')
+                except sqlite3.OperationalError:
+                    if db.in_transaction:
+                        db.execute('ROLLBACK')
+                    count('errors')
+            db.close()
+
+        threads = [threading.Thread(target=reader) for _ in range(options['readers'])]
+        threads += [threading.Thread(target=writer) for _ in range(options['writers'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return counters['reads'], counters['writes'], counters['errors']
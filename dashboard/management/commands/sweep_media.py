@@ -0,0 +1,75 @@
+import os
+import posixpath
+import time
+
+from django.core.management.base import BaseCommand
+
+from dashboard.images import VARIANTS_DIR, file_fields, variant_storage
+from dashboard.storage import scan_files
+
+
+class Command(BaseCommand):
+    help = (
+        "Hech bir yozuv ishlatmayotgan media fayllarni (o'chirilgan yoki almashtirilgan "
+        "yuklamalar va ularning variantlari) topish va o'chirish. FileField'lar ishlatadigan "
+        "barcha saqlagichlar (MEDIA_ROOT, private_media va h.k.) ko'riladi"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help="Faqat hisobot, hech narsa o'chirilmaydi")
+        parser.add_argument(
+            '--older-than', type=int, default=24,
+            help="Shundan yosh (soat) fayllarga tegilmaydi — hali saqlanmagan yuklamalar uchun",
+        )
+        parser.add_argument('--batch', type=int, default=2000, help="values_list so'rovi bo'lagi hajmi")
+
+    def handle(self, *args, **options):
+        cutoff = time.time() - options['older_than'] * 3600
+        variants_root = os.path.abspath(variant_storage.location)
+        scanned = removed = freed = 0
+
+        for root_dir, (referenced, roots) in self.referenced_names(options['batch']).items():
+            for entry in scan_files(root_dir):
+                scanned += 1
+                name = os.path.relpath(entry.path, root_dir).replace(os.sep, '/')
+                if root_dir == variants_root and name.startswith(VARIANTS_DIR + '/'):
+                    # variants/<asl fayl ildizi>/<kenglik>.<ext> — asl fayl bilan birga yashaydi
+                    used = posixpath.dirname(name[len(VARIANTS_DIR) + 1:]) in roots
+                else:
+                    used = name in referenced
+                if used:
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+                if stat.st_mtime > cutoff:
+                    continue
+                removed += 1
+                freed += stat.st_size
+                if options['dry_run']:
+                    self.stdout.write(f"  {entry.path}")
+                else:
+                    os.remove(entry.path)
+
+        verb = "O'chiriladi" if options['dry_run'] else "O'chirildi"
+        self.stdout.write(self.style.SUCCESS(
+            f"Ko'rildi: {scanned}, {verb}: {removed} ({freed / 1024 / 1024:.1f} MB)"
+        ))
+
+    def referenced_names(self, batch):
+        """{saqlagich papkasi: (ishlatilgan nomlar, nomlar ildizi)}."""
+        # Variantlar MEDIA_ROOT da — unga hech bir maydon yozmasa ham ko'riladi
+        locations = {os.path.abspath(variant_storage.location): (set(), set())}
+        for model, field in file_fields():
+            location = getattr(field.storage, 'location', None)
+            if location is None:
+                # Mahalliy papkasi yo'q saqlagich (S3 va h.k.) — bu buyruq doirasidan tashqari
+                continue
+            referenced, roots = locations.setdefault(os.path.abspath(location), (set(), set()))
+            names = (
+                model._default_manager.exclude(**{f'{field.name}__isnull': True})
+                .exclude(**{field.name: ''})
+                .values_list(field.name, flat=True)
+            )
+            for name in names.iterator(chunk_size=batch):
+                referenced.add(name)
+                roots.add(posixpath.splitext(name)[0])
+        return locations
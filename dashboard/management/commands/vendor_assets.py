@@ -0,0 +1,141 @@
+import io
+import json
+import re
+import urllib.request
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from fontTools import subset as font_subset
+
+from dashboard.assets import ASSETS, PRELOAD_MANIFEST, VENDOR_DIR
+
+# Google Fonts woff2 qaytarishi uchun zamonaviy brauzer nomi kerak
+USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36'
+FONT_SUBSETS = ('latin', 'latin-ext', 'cyrillic')
+# Sahifa guruhi -> shriftlar CSS kaliti (dashboard.assets.PROJECT_PRELOADS bilan bir xil guruhlar)
+GROUP_FONTS = {'landing': 'fonts-landing', 'app': 'fonts-app'}
+ICONS_CSS_URL = 'https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.3/font/bootstrap-icons.css'
+ICONS_FONT_URL = 'https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.3/font/fonts/bootstrap-icons.woff2'
+
+SOURCE_MAP_RE = re.compile(r'^\s*(/\*# sourceMappingURL=.*?\*/|//# sourceMappingURL=.*)$', re.M)
+FONT_FACE_RE = re.compile(r'/\* ([\w-]+) \*/\s*(@font-face\s*\{.*?\})', re.S)
+ICON_RULE_RE = re.compile(r'\.bi-([a-z0-9-]+)::before\s*\{\s*content:\s*"\\([0-9a-f]+)";\s*\}')
+ICON_USE_RE = re.compile(r"\bbi-([a-z0-9]+(?:-[a-z0-9]+)*)\b|bi-\{\{[^}]*default:'([a-z0-9-]+)'")
+
+
+def fetch(url):
+    request = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return response.read()
+
+
+class Command(BaseCommand):
+    help = (
+        "Bootstrap, Bootstrap Icons, AOS va Google Fonts fayllarini static/vendor ga yuklab olish. "
+        "Ikonkalardan faqat shablonlarda va bazada ishlatilganlari, shriftlardan faqat "
+        "lotin/kirill qismlari olinadi. Natija repoga qo'shiladi."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all-icons', action='store_true', help="Ikonkalar to'plamini qisqartirmaslik")
+
+    def handle(self, *args, **options):
+        if not settings.STATICFILES_DIRS:
+            raise CommandError("STATICFILES_DIRS bo'sh")
+        self.static_root = Path(settings.STATICFILES_DIRS[0])
+
+        for key in ('bootstrap-css', 'bootstrap-js', 'aos-css', 'aos-js'):
+            path, url = ASSETS[key]
+            # Manifest saqlagich mavjud bo'lmagan .map fayllarni qidirmasligi uchun
+            self.write(path, SOURCE_MAP_RE.sub('', fetch(url).decode()).encode())
+
+        icons_font = self.vendor_icons(None if options['all_icons'] else self.used_icons())
+        preloads = {}
+        for group, key in GROUP_FONTS.items():
+            fonts_css, url = ASSETS[key]
+            preloads[group] = [
+                [ASSETS['bootstrap-css'][0], 'style'],
+                [fonts_css, 'style'],
+                *[[path, 'font'] for path in self.vendor_fonts(fonts_css, url)],
+                [icons_font, 'font'],
+            ]
+        # Preload ro'yxati faqat haqiqatda yozilgan fayllardan tuziladi
+        self.write(PRELOAD_MANIFEST, json.dumps(preloads, indent=2).encode() + b'\n')
+
+    def write(self, path, content):
+        target = self.static_root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+        self.stdout.write(f"  {path} ({len(content) / 1024:.1f} KB)")
+
+    def used_icons(self):
+        sources = [Path(d) for template in settings.TEMPLATES for d in template['DIRS']]
+        sources += [Path(d) for d in settings.STATICFILES_DIRS]
+        names = set()
+        for source in sources:
+            for path in source.rglob('*'):
+                if path.suffix not in ('.html', '.js', '.css') or VENDOR_DIR in path.relative_to(source).parts:
+                    continue
+                for match in ICON_USE_RE.finditer(path.read_text(errors='ignore')):
+                    names.add(match.group(1) or match.group(2))
+        # Admin kiritadigan ikonkalar (Laboratory.icon va h.k.)
+        for model in apps.get_models():
+            for field in model._meta.fields:
+                if field.name == 'icon':
+                    names.update(model._default_manager.exclude(icon='').values_list('icon', flat=True))
+        return names
+
+    def vendor_icons(self, names):
+        css = fetch(ICONS_CSS_URL).decode()
+        rules = ICON_RULE_RE.findall(css)
+        header = css[:css.index('.bi-')]
+        header = re.sub(r'src:[^;]*;', 'src: url("bootstrap-icons.woff2") format("woff2");', header, count=1)
+        if names is not None:
+            rules = [(name, code) for name, code in rules if name in names]
+        body = '\n'.join(f'.bi-{name}::before {{ content: "\\{code}"; }}' for name, code in rules)
+        self.write(f'{VENDOR_DIR}/bootstrap-icons/bootstrap-icons.css', (header + body + '\n').encode())
+
+        font = fetch(ICONS_FONT_URL)
+        if names is not None:
+            font = self.subset_font(font, [int(code, 16) for _, code in rules])
+        path = f'{VENDOR_DIR}/bootstrap-icons/bootstrap-icons.woff2'
+        self.write(path, font)
+        return path
+
+    def subset_font(self, font, codepoints):
+        subsetter = font_subset.Subsetter(font_subset.Options(flavor='woff2'))
+        source = font_subset.load_font(io.BytesIO(font), font_subset.Options())
+        subsetter.populate(unicodes=codepoints)
+        subsetter.subset(source)
+        output = io.BytesIO()
+        source.flavor = 'woff2'
+        source.save(output)
+        return output.getvalue()
+
+    def vendor_fonts(self, path, url):
+        """Yozilgan fayllardan birinchi shrift oilasining lotin qismini qaytaradi (preload uchun)."""
+        css = fetch(url).decode()
+        directory = Path(path).parent
+        faces, files, primary = [], {}, []
+        first_family = None
+        for subset, face in FONT_FACE_RE.findall(css):
+            if subset not in FONT_SUBSETS:
+                continue
+            family = re.search(r"font-family:\s*'([^']+)'", face).group(1)
+            font_url = re.search(r'url\((https://[^)]+\.woff2)\)', face).group(1)
+            if font_url not in files:
+                # O'zgaruvchan shriftlarda barcha og'irliklar bitta faylda: inter-latin.woff2
+                name = f"{family.lower().replace(' ', '-')}-{subset}.woff2"
+                if name in files.values():
+                    weight = re.search(r'font-weight:\s*(\d+)', face).group(1)
+                    name = name.replace('.woff2', f'-{weight}.woff2')
+                files[font_url] = name
+                self.write(f'{directory}/{name}', fetch(font_url))
+                first_family = first_family or family
+                if family == first_family and subset == 'latin':
+                    primary.append(f'{directory}/{name}')
+            faces.append(f'/* {subset} */\n' + face.replace(font_url, files[font_url]))
+        self.write(path, '\n'.join(faces).encode() + b'\n')
+        return primary
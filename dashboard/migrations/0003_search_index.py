@@ -0,0 +1,69 @@
+from django.db import migrations
+
+# FTS5 indeksi: rowid = obyekt_id * 8 + model_kodi, shu sababli yozuvni
+# o'chirish va yangilash to'liq skanersiz, rowid bo'yicha bajariladi.
+# Jadval qayta qurilganda (AlterField va h.k.) triggerlar o'chib ketadi —
+# ularni `manage.py rebuild_search_index` qayta yaratadi (dashboard.search).
+INDEXED_TABLES = [
+    # (kod, jadval, sarlavha ifodasi, matn ifodasi)
+    (1, 'dashboard_laboratory', "{row}.name", "{row}.description"),
+    (2, 'dashboard_program', "{row}.name", "{row}.description"),
+    (3, 'dashboard_event', "{row}.title", "{row}.description || ' ' || {row}.location"),
+    (4, 'dashboard_project', "{row}.title", "{row}.description || ' ' || {row}.team_members"),
+    (5, 'dashboard_news', "{row}.title", "{row}.content"),
+    (6, 'accounts_user', "{row}.username || ' ' || {row}.first_name || ' ' || {row}.last_name", "coalesce({row}.email, '')"),
+]
+
+
+def _insert(code, title, body, row):
+    return (
+        f"INSERT INTO dashboard_searchindex(rowid, title, body) "
+        f"VALUES ({row}.id * 8 + {code}, {title.format(row=row)}, {body.format(row=row)});"
+    )
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE dashboard_searchindex USING fts5("
+        "title, body, tokenize = 'unicode61 remove_diacritics 2')"
+    )
+    for code, table, title, body in INDEXED_TABLES:
+        delete = f"DELETE FROM dashboard_searchindex WHERE rowid = old.id * 8 + {code};"
+        schema_editor.execute(
+            f"CREATE TRIGGER {table}_search_ai AFTER INSERT ON {table} BEGIN "
+            f"{_insert(code, title, body, 'new')} END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {table}_search_au AFTER UPDATE ON {table} BEGIN "
+            f"{delete} {_insert(code, title, body, 'new')} END"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {table}_search_ad AFTER DELETE ON {table} BEGIN {delete} END"
+        )
+        schema_editor.execute(
+            f"INSERT INTO dashboard_searchindex(rowid, title, body) "
+            f"SELECT id * 8 + {code}, {title.format(row=table)}, {body.format(row=table)} FROM {table}"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for code, table, title, body in INDEXED_TABLES:
+        for suffix in ('ai', 'au', 'ad'):
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {table}_search_{suffix}")
+    schema_editor.execute("DROP TABLE IF EXISTS dashboard_searchindex")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('dashboard', '0002_project_is_approved'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
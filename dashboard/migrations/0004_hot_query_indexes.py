@@ -0,0 +1,64 @@
+# Generated by Django 6.0.2 on 2026-10-18 09:12
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+# Takroriy arizalardan qaysi biri qoladi: ko'rib chiqilgan qaror kutilayotgan
+# arizadan ustun, teng bo'lsa eng birinchisi
+STATUS_PRIORITY = {'approved': 0, 'rejected': 1, 'pending': 2}
+
+
+def remove_duplicate_applications(apps, schema_editor):
+    # Unikal cheklovdan oldin har bir (user, program) uchun bitta ariza qoldiriladi
+    Application = apps.get_model('dashboard', 'Application')
+    duplicates = (
+        Application.objects.values('user_id', 'program_id')
+        .annotate(total=Count('id'))
+        .filter(total__gt=1)
+    )
+    for row in duplicates:
+        group = Application.objects.filter(user_id=row['user_id'], program_id=row['program_id'])
+        rows = group.values_list('id', 'status', 'created_at')
+        keep_id = min(rows, key=lambda r: (STATUS_PRIORITY.get(r[1], len(STATUS_PRIORITY)), r[2], r[0]))[0]
+        group.exclude(id=keep_id).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0003_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='application_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['-created_at', '-id'], name='application_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-date'], name='event_active_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-created_at'], name='news_published_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='program',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at'], name='program_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_approved', True)), fields=['-created_at'], name='project_approved_created_idx'),
+        ),
+        migrations.RunPython(remove_duplicate_applications, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='application',
+            constraint=models.UniqueConstraint(fields=('user', 'program'), name='application_user_program_uniq'),
+        ),
+    ]
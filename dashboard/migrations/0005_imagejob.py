@@ -0,0 +1,33 @@
+# Generated by Django 6.0.2 on 2026-10-18 11:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0004_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True, verbose_name='Fayl')),
+                ('status', models.CharField(choices=[('pending', 'Navbatda'), ('processing', 'Ishlanmoqda'), ('done', 'Tayyor'), ('failed', 'Xato')], default='pending', max_length=20, verbose_name='Holat')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Urinishlar')),
+                ('last_error', models.TextField(blank=True, verbose_name='Oxirgi xato')),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Bajarish vaqti')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Rasm vazifasi',
+                'verbose_name_plural': 'Rasm vazifalari',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(condition=models.Q(('status', 'pending')), fields=['run_after'], name='imagejob_pending_idx')],
+            },
+        ),
+    ]
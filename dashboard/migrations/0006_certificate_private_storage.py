@@ -0,0 +1,34 @@
+# Generated by Django 6.0.2 on 2026-10-18 07:30
+
+import os
+
+import dashboard.storage
+from django.conf import settings
+from django.db import migrations, models
+
+
+def move_certificates(apps, schema_editor):
+    # Avval MEDIA_ROOT ga (ommaga ochiq) yuklangan sertifikatlarni himoyalangan saqlagichga ko'chirish
+    storage = dashboard.storage.private_storage()
+    Certificate = apps.get_model('dashboard', 'Certificate')
+    for name in Certificate.objects.exclude(pdf_file='').exclude(pdf_file__isnull=True).values_list('pdf_file', flat=True):
+        public_path = os.path.join(settings.MEDIA_ROOT, name)
+        if os.path.exists(public_path) and not storage.exists(name):
+            os.makedirs(os.path.dirname(storage.path(name)), exist_ok=True)
+            os.replace(public_path, storage.path(name))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0005_imagejob'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='certificate',
+            name='pdf_file',
+            field=models.FileField(blank=True, null=True, storage=dashboard.storage.private_storage, upload_to='certificates/', verbose_name='PDF fayl'),
+        ),
+        migrations.RunPython(move_certificates, migrations.RunPython.noop),
+    ]
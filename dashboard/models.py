@@ -1,5 +1,8 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
+
+from .storage import private_storage
 
 
 class Laboratory(models.Model):
@@ -48,6 +51,9 @@ class Program(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at'], condition=models.Q(is_active=True), name='program_active_created_idx'),
+        ]
         verbose_name = "Dastur"
         verbose_name_plural = "Dasturlar"
 
@@ -74,6 +80,9 @@ class Event(models.Model):
 
     class Meta:
         ordering = ['-date']
+        indexes = [
+            models.Index(fields=['-date'], condition=models.Q(is_active=True), name='event_active_date_idx'),
+        ]
         verbose_name = "Tadbir"
         verbose_name_plural = "Tadbirlar"
 
@@ -100,6 +109,13 @@ class Project(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['-created_at'],
+                condition=models.Q(is_active=True, is_approved=True),
+                name='project_approved_created_idx',
+            ),
+        ]
         verbose_name = "Loyiha"
         verbose_name_plural = "Loyihalar"
 
@@ -139,6 +155,13 @@ class Application(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', '-created_at', '-id'], name='application_status_created_idx'),
+            models.Index(fields=['-created_at', '-id'], name='application_created_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'program'], name='application_user_program_uniq'),
+        ]
         verbose_name = "Ariza"
         verbose_name_plural = "Arizalar"
 
@@ -152,7 +175,7 @@ class Certificate(models.Model):
     title = models.CharField(max_length=300, verbose_name="Sarlavha")
     certificate_id = models.CharField(max_length=50, unique=True, verbose_name="Sertifikat ID")
     issued_date = models.DateField(verbose_name="Berilgan sana")
-    pdf_file = models.FileField(upload_to='certificates/', blank=True, null=True, verbose_name="PDF fayl")
+    pdf_file = models.FileField(upload_to='certificates/', storage=private_storage, blank=True, null=True, verbose_name="PDF fayl")
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -176,6 +199,9 @@ class News(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at'], condition=models.Q(is_published=True), name='news_published_created_idx'),
+        ]
         verbose_name = "Yangilik"
         verbose_name_plural = "Yangiliklar"
 
@@ -213,3 +239,30 @@ class SiteSetting(models.Model):
     def get_settings(cls):
         obj, created = cls.objects.get_or_create(pk=1)
         return obj
+
+
+class ImageJob(models.Model):
+    STATUS_CHOICES = (
+        ('pending', 'Navbatda'),
+        ('processing', 'Ishlanmoqda'),
+        ('done', 'Tayyor'),
+        ('failed', 'Xato'),
+    )
+    name = models.CharField(max_length=255, unique=True, verbose_name="Fayl")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', verbose_name="Holat")
+    attempts = models.PositiveIntegerField(default=0, verbose_name="Urinishlar")
+    last_error = models.TextField(blank=True, verbose_name="Oxirgi xato")
+    run_after = models.DateTimeField(default=timezone.now, verbose_name="Bajarish vaqti")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['run_after'], condition=models.Q(status='pending'), name='imagejob_pending_idx'),
+        ]
+        verbose_name = "Rasm vazifasi"
+        verbose_name_plural = "Rasm vazifalari"
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,123 @@
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+PER_PAGE = 25
+
+
+def _encode_cursor(obj, field_name):
+    raw = json.dumps([getattr(obj, field_name), obj.pk], default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def _decode_cursor(cursor, field):
+    """Kursorni (qiymat, pk) juftligiga aylantirish; buzilgan kursor e'tiborsiz qoldiriladi."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        value, pk = json.loads(raw)
+        value, pk = field.to_python(value), int(pk)
+    except (ValueError, TypeError, ValidationError):
+        return None
+    # Qo'lda yasalgan [null, pk] kursori "None bilan solishtirish" xatosiga olib kelmasin
+    return None if value is None else (value, pk)
+
+
+class KeysetPage:
+    def __init__(self, request, object_list, field_name, has_next, has_previous):
+        self.request = request
+        self.object_list = object_list
+        self.field_name = field_name
+        self.has_next = has_next
+        self.has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def _query(self, **params):
+        # search, status va boshqa filtrlar sahifalar orasida saqlanadi
+        query = self.request.GET.copy()
+        query.pop('after', None)
+        query.pop('before', None)
+        for key, value in params.items():
+            query[key] = value
+        return query.urlencode()
+
+    @property
+    def next_query(self):
+        if self.has_next and self.object_list:
+            return self._query(after=_encode_cursor(self.object_list[-1], self.field_name))
+        return ''
+
+    @property
+    def previous_query(self):
+        if self.has_previous and self.object_list:
+            return self._query(before=_encode_cursor(self.object_list[0], self.field_name))
+        return ''
+
+
+class RankedPage(KeysetPage):
+    """
+    Moslik (rank) bo'yicha tartiblangan natijalar sahifasi. Rank ustun emas —
+    kursor qurib bo'lmaydi, shu sababli ?page=N raqami ishlatiladi.
+    """
+
+    def __init__(self, request, object_list, number, has_next):
+        super().__init__(request, object_list, None, has_next=has_next, has_previous=number > 1)
+        self.number = number
+
+    @property
+    def next_query(self):
+        return self._query(page=self.number + 1) if self.has_next else ''
+
+    @property
+    def previous_query(self):
+        return self._query(page=self.number - 1) if self.has_previous else ''
+
+
+def page_number(request):
+    page = request.GET.get('page', '')
+    return int(page) if page.isdigit() and int(page) > 0 else 1
+
+
+def keyset_paginate(request, queryset, ordering='-created_at', per_page=PER_PAGE):
+    """
+    OFFSET o'rniga (maydon, pk) kursori bo'yicha sahifalash.
+    ?after=... keyingi, ?before=... oldingi sahifani beradi.
+    """
+    descending = ordering.startswith('-')
+    field_name = ordering.lstrip('-')
+    field = queryset.model._meta.get_field(field_name)
+
+    backwards = False
+    cursor = _decode_cursor(request.GET.get('after'), field)
+    if cursor is None:
+        cursor = _decode_cursor(request.GET.get('before'), field)
+        backwards = cursor is not None
+
+    # Oldingi sahifa teskari tartibda olinib, keyin qayta aylantiriladi
+    reverse = descending != backwards
+    lookup = 'lt' if reverse else 'gt'
+    if reverse:
+        queryset = queryset.order_by(f'-{field_name}', '-pk')
+    else:
+        queryset = queryset.order_by(field_name, 'pk')
+    if cursor is not None:
+        value, pk = cursor
+        queryset = queryset.filter(
+            Q(**{f'{field_name}__{lookup}': value}) | Q(**{field_name: value, f'pk__{lookup}': pk})
+        )
+
+    items = list(queryset[:per_page + 1])
+    has_more = len(items) > per_page
+    items = items[:per_page]
+    if backwards:
+        items.reverse()
+        return KeysetPage(request, items, field_name, has_next=True, has_previous=has_more)
+    return KeysetPage(request, items, field_name, has_next=has_more, has_previous=cursor is not None)
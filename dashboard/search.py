@@ -0,0 +1,146 @@
+import re
+
+from django.db import connection, connections, router, transaction
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from .pagination import PER_PAGE, RankedPage, page_number
+
+# 0003_search_index migratsiyasidagi model kodlari bilan bir xil bo'lishi kerak
+INDEXED_MODELS = {
+    'dashboard.laboratory': 1,
+    'dashboard.program': 2,
+    'dashboard.event': 3,
+    'dashboard.project': 4,
+    'dashboard.news': 5,
+    'accounts.user': 6,
+}
+
+# Indeksni jadvallar bilan sinxron tutuvchi triggerlar — 0003_search_index dagi bilan bir xil.
+# MUHIM: SQLite'da jadvalni qayta quradigan har qanday migratsiya (AlterField,
+# RemoveField va h.k. — Django _remake_table) shu jadvaldagi triggerlarni jimgina
+# o'chirib yuboradi va qidiruv xatosiz eskirib boradi. Bunday migratsiyadan keyin
+# `manage.py rebuild_search_index` ishga tushiriladi; dashboard.E001 tekshiruvi
+# (`manage.py check --database default`) yo'qolgan triggerlarni ko'rsatadi.
+INDEXED_TABLES = [
+    # (kod, jadval, sarlavha ifodasi, matn ifodasi)
+    (1, 'dashboard_laboratory', "{row}.name", "{row}.description"),
+    (2, 'dashboard_program', "{row}.name", "{row}.description"),
+    (3, 'dashboard_event', "{row}.title", "{row}.description || ' ' || {row}.location"),
+    (4, 'dashboard_project', "{row}.title", "{row}.description || ' ' || {row}.team_members"),
+    (5, 'dashboard_news', "{row}.title", "{row}.content"),
+    (6, 'accounts_user', "{row}.username || ' ' || {row}.first_name || ' ' || {row}.last_name", "coalesce({row}.email, '')"),
+]
+TRIGGER_SUFFIXES = ('ai', 'au', 'ad')
+
+_MARK_START, _MARK_END = '\x02', '\x03'
+
+
+def _insert(code, title, body, row):
+    return (
+        f"INSERT INTO dashboard_searchindex(rowid, title, body) "
+        f"VALUES ({row}.id * 8 + {code}, {title.format(row=row)}, {body.format(row=row)});"
+    )
+
+
+def _trigger_statements(code, table, title, body):
+    delete = f"DELETE FROM dashboard_searchindex WHERE rowid = old.id * 8 + {code};"
+    return [
+        f"CREATE TRIGGER {table}_search_ai AFTER INSERT ON {table} BEGIN "
+        f"{_insert(code, title, body, 'new')} END",
+        f"CREATE TRIGGER {table}_search_au AFTER UPDATE ON {table} BEGIN "
+        f"{delete} {_insert(code, title, body, 'new')} END",
+        f"CREATE TRIGGER {table}_search_ad AFTER DELETE ON {table} BEGIN {delete} END",
+    ]
+
+
+def missing_search_triggers(using='default'):
+    """
+    Yo'qolgan trigger nomlari. Indeks jadvali hali yaratilmagan bo'lsa
+    (0003 migratsiyasi qo'llanmagan) yoki baza SQLite emas — bo'sh ro'yxat.
+    """
+    if connections[using].vendor != 'sqlite':
+        return []
+    with connections[using].cursor() as cursor:
+        cursor.execute("SELECT type, name FROM sqlite_master WHERE type IN ('table', 'trigger')")
+        existing = {(kind, name) for kind, name in cursor.fetchall()}
+    if ('table', 'dashboard_searchindex') not in existing:
+        return []
+    return [
+        f'{table}_search_{suffix}'
+        for code, table, title, body in INDEXED_TABLES
+        for suffix in TRIGGER_SUFFIXES
+        if ('trigger', f'{table}_search_{suffix}') not in existing
+    ]
+
+
+def rebuild_search_index(using='default'):
+    """Triggerlarni qayta yaratish va indeksni jadvallardan to'liq qayta to'ldirish."""
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        for code, table, title, body in INDEXED_TABLES:
+            for suffix in TRIGGER_SUFFIXES:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {table}_search_{suffix}")
+            for statement in _trigger_statements(code, table, title, body):
+                cursor.execute(statement)
+        cursor.execute("DELETE FROM dashboard_searchindex")
+        for code, table, title, body in INDEXED_TABLES:
+            cursor.execute(
+                f"INSERT INTO dashboard_searchindex(rowid, title, body) "
+                f"SELECT id * 8 + {code}, {title.format(row=table)}, {body.format(row=table)} FROM {table}"
+            )
+
+
+def is_indexed(model):
+    return connection.vendor == 'sqlite' and model._meta.label_lower in INDEXED_MODELS
+
+
+def _match_expression(query):
+    # Foydalanuvchi kiritgan matn FTS5 sintaksisi sifatida talqin qilinmasligi
+    # uchun so'zlarga ajratilib, har biri prefiks qidiruviga aylantiriladi
+    words = re.findall(r'\w+', query)
+    return ' '.join(f'"{word}"*' for word in words)
+
+
+def _highlight(snippet):
+    return mark_safe(
+        escape(snippet).replace(_MARK_START, '<mark>').replace(_MARK_END, '</mark>')
+    )
+
+
+def ranked(request, queryset, query, per_page=PER_PAGE):
+    """
+    Queryset ichidan FTS5 bo'yicha mos obyektlar (bm25 tartibida), ?page=N sahifasi.
+    Queryset filtrlari (masalan, role=) LIMIT dan oldin FTS so'rovining o'zida
+    qo'llanadi — filtrga mos natijalar reytingi qanchalik past bo'lmasin yo'qolmaydi.
+    Har bir obyektga ajratib ko'rsatilgan `search_snippet` biriktiriladi.
+    """
+    number = page_number(request)
+    match = _match_expression(query)
+    if not match:
+        return RankedPage(request, [], number, has_next=False)
+    code = INDEXED_MODELS[queryset.model._meta.label_lower]
+    using = router.db_for_read(queryset.model)
+    allowed_sql, allowed_params = (
+        queryset.order_by().values('pk').query.get_compiler(using=using).as_sql()
+    )
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT rowid / 8, snippet(dashboard_searchindex, -1, %s, %s, '…', 12) "
+            "FROM dashboard_searchindex "
+            "WHERE dashboard_searchindex MATCH %s AND rowid %% 8 = %s "
+            f"AND rowid / 8 IN ({allowed_sql}) "
+            "ORDER BY rank LIMIT %s OFFSET %s",
+            [_MARK_START, _MARK_END, match, code, *allowed_params, per_page + 1, (number - 1) * per_page],
+        )
+        hits = cursor.fetchall()
+
+    has_next = len(hits) > per_page
+    hits = hits[:per_page]
+    objects = queryset.in_bulk([pk for pk, snippet in hits])
+    results = []
+    for pk, snippet in hits:
+        obj = objects.get(pk)
+        if obj is not None:
+            obj.search_snippet = _highlight(snippet)
+            results.append(obj)
+    return RankedPage(request, results, number, has_next=has_next)
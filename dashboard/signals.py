@@ -0,0 +1,95 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import Signal
+
+from . import cache as reference_cache
+from .images import has_variants, image_fields
+from .jobs import enqueue_image
+from .models import Application, Laboratory, Partner, SiteSetting
+from .stats import STATS_MODELS, invalidate_stats
+
+# update()/bulk_create() model signallarini chaqirmaydi — ommaviy amallar shu signal
+# orqali qaysi talabalar arizalari/sertifikatlari o'zgarganini bildiradi (user_ids)
+applications_changed = Signal()
+
+REFERENCE_MODELS = {
+    SiteSetting: 'site_settings',
+    Laboratory: 'laboratories',
+    Partner: 'partners',
+}
+
+
+def _invalidate_reference(sender, **kwargs):
+    reference_cache.invalidate(REFERENCE_MODELS[sender])
+
+
+for model in REFERENCE_MODELS:
+    post_save.connect(_invalidate_reference, sender=model, dispatch_uid=f'reference_save_{model.__name__}')
+    post_delete.connect(_invalidate_reference, sender=model, dispatch_uid=f'reference_delete_{model.__name__}')
+
+
+# ==================== PENDING APPLICATIONS ====================
+
+def _is_pending(status):
+    return status == 'pending'
+
+
+def _remember_status(sender, instance, **kwargs):
+    # Saqlashda eski holatni bilish uchun bazadan o'qilgan qiymat eslab qolinadi
+    instance._loaded_status = instance.__dict__.get('status')
+
+
+def _pending_saved(sender, instance, created, **kwargs):
+    # Hisoblagich o'chiriladi va keyingi o'qishda qayta sanaladi: bir nechta worker
+    # bir vaqtda get+set qilsa yangilanishlar yo'qolib, son siljib ketardi
+    if created:
+        changed = _is_pending(instance.status)
+    elif instance._loaded_status is None:
+        # Holat maydoni yuklanmagan (only/defer) — o'zgargan-o'zgarmagani noma'lum
+        changed = True
+    else:
+        changed = _is_pending(instance.status) != _is_pending(instance._loaded_status)
+    instance._loaded_status = instance.status
+    if changed:
+        transaction.on_commit(reference_cache.invalidate_pending_count)
+
+
+def _pending_deleted(sender, instance, **kwargs):
+    if _is_pending(instance._loaded_status):
+        transaction.on_commit(reference_cache.invalidate_pending_count)
+
+
+post_init.connect(_remember_status, sender=Application, dispatch_uid='application_remember_status')
+post_save.connect(_pending_saved, sender=Application, dispatch_uid='application_pending_save')
+post_delete.connect(_pending_deleted, sender=Application, dispatch_uid='application_pending_delete')
+
+
+# ==================== DASHBOARD STATS ====================
+
+def _invalidate_stats(sender, **kwargs):
+    transaction.on_commit(invalidate_stats)
+
+
+for model in STATS_MODELS:
+    post_save.connect(_invalidate_stats, sender=model, dispatch_uid=f'stats_save_{model.__name__}')
+    post_delete.connect(_invalidate_stats, sender=model, dispatch_uid=f'stats_delete_{model.__name__}')
+
+
+# ==================== IMAGE VARIANTS ====================
+
+def _schedule_variants(sender, instance, **kwargs):
+    # Ishlov process_image_jobs worker'ida bajariladi, so'rov faqat navbatga yozadi
+    for field in _IMAGE_FIELDS[sender]:
+        file = getattr(instance, field.attname)
+        if file and not has_variants(file.name):
+            transaction.on_commit(partial(enqueue_image, file.name))
+
+
+_IMAGE_FIELDS = {}
+for model, field in image_fields():
+    _IMAGE_FIELDS.setdefault(model, []).append(field)
+
+for model in _IMAGE_FIELDS:
+    post_save.connect(_schedule_variants, sender=model, dispatch_uid=f'image_variants_{model.__name__}')
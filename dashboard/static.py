@@ -0,0 +1,141 @@
+import hashlib
+import mimetypes
+import mmap
+import os
+import re
+from email.utils import formatdate, parsedate_to_datetime
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+
+from .compression import choose_encoding
+from .downloads import parse_range
+from .storage import scan_files
+
+# ManifestStaticFilesStorage nomlari: landing.e10b9952514b.css — tarkib o'zgarsa nom ham o'zgaradi
+HASHED_NAME_RE = re.compile(r'\.[0-9a-f]{12}\.[^/.]+$')
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+
+
+class StaticFile:
+    def __init__(self, path, stat, content_type):
+        self.path = path
+        self.size = stat.st_size
+        self.last_modified = formatdate(stat.st_mtime, usegmt=True)
+        self.mtime = int(stat.st_mtime)
+        self.content_type = content_type
+        with open(path, 'rb') as fh:
+            self.etag = '"%s"' % hashlib.blake2b(fh.read(), digest_size=16).hexdigest()
+        self._map = None
+
+    def read(self, start=0, end=None):
+        # Fayl birinchi so'rovda xotiraga akslantiriladi; keyin o'qish sahifa keshidan
+        if self._map is None:
+            if not self.size:
+                return b''
+            with open(self.path, 'rb') as fh:
+                self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[start:end]
+
+
+class StaticFilesMiddleware:
+    """
+    STATIC_ROOT dagi fayllarni alohida veb-serversiz yuborish (DEBUG=False uchun).
+    Fayllar ishga tushishda indekslanadi; so'rov URL rezolveri, sessiya va
+    autentifikatsiyagacha yetib bormaydi. Kuchli ETag, 304, Range, .br/.gz tanlovi.
+    """
+
+    def __init__(self, get_response):
+        if settings.DEBUG or not settings.STATIC_ROOT or not os.path.isdir(settings.STATIC_ROOT):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.prefix = '/' + settings.STATIC_URL.lstrip('/')
+        self.files = self.build_index(os.path.abspath(settings.STATIC_ROOT))
+
+    def build_index(self, root):
+        files = {}
+        for entry in scan_files(root):
+            name = os.path.relpath(entry.path, root).replace(os.sep, '/')
+            content_type, _ = mimetypes.guess_type(name)
+            content_type = content_type or 'application/octet-stream'
+            if content_type.startswith('text/') or content_type in ('application/javascript', 'image/svg+xml'):
+                content_type += '; charset=utf-8'
+            files[name] = StaticFile(entry.path, entry.stat(), content_type)
+
+        index = {}
+        for name, static_file in files.items():
+            if name.endswith(('.br', '.gz')) and name[:-3] in files:
+                continue
+            static_file.variants = [
+                (encoding, files[name + suffix])
+                for encoding, suffix in ENCODINGS
+                if name + suffix in files
+            ]
+            static_file.cache_control = (
+                IMMUTABLE_CACHE if HASHED_NAME_RE.search(name)
+                else f'public, max-age={settings.STATIC_MAX_AGE}'
+            )
+            index[name] = static_file
+        return index
+
+    def __call__(self, request):
+        if request.method in ('GET', 'HEAD') and request.path_info.startswith(self.prefix):
+            static_file = self.files.get(request.path_info[len(self.prefix):])
+            if static_file is not None:
+                return self.serve(request, static_file)
+        return self.get_response(request)
+
+    def serve(self, request, static_file):
+        served, encoding = static_file, None
+        range_header = request.headers.get('Range')
+        if static_file.variants and not range_header:
+            variants = dict(static_file.variants)
+            encoding = choose_encoding(request.headers.get('Accept-Encoding', ''), list(variants))
+            if encoding is not None:
+                served = variants[encoding]
+        # Siqilgan nusxa alohida fayl — uning ETag'i ham o'zi bo'yicha hisoblangan
+        etag = served.etag
+
+        if self.not_modified(request, etag, static_file):
+            response = HttpResponseNotModified()
+        else:
+            start, end, status = 0, served.size, 200
+            if range_header:
+                try:
+                    byte_range = parse_range(range_header, served.size)
+                except ValueError:
+                    response = HttpResponse(status=416)
+                    response['Content-Range'] = f'bytes */{served.size}'
+                    return response
+                if byte_range is not None:
+                    start, end, status = byte_range[0], byte_range[1] + 1, 206
+            body = b'' if request.method == 'HEAD' else served.read(start, end)
+            response = HttpResponse(body, status=status, content_type=static_file.content_type)
+            response['Content-Length'] = end - start
+            if status == 206:
+                response['Content-Range'] = f'bytes {start}-{end - 1}/{served.size}'
+            if encoding is not None:
+                response['Content-Encoding'] = encoding
+            response['Accept-Ranges'] = 'bytes'
+
+        response['ETag'] = etag
+        response['Last-Modified'] = static_file.last_modified
+        response['Cache-Control'] = static_file.cache_control
+        if static_file.variants:
+            response['Vary'] = 'Accept-Encoding'
+        return response
+
+    def not_modified(self, request, etag, static_file):
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match is not None:
+            return etag in parse_etags(if_none_match) or if_none_match.strip() == '*'
+        if_modified_since = request.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                return parsedate_to_datetime(if_modified_since).timestamp() >= static_file.mtime
+            except (TypeError, ValueError):
+                return False
+        return False
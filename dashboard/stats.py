@@ -0,0 +1,56 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, router
+
+from accounts.models import User
+from .models import (
+    Laboratory, Program, Event, Project,
+    Partner, Application, Certificate, News
+)
+
+DASHBOARD_STATS_KEY = 'dashboard:stats'
+
+# Ko'rsatkichlarga ta'sir qiladigan modellar (signal orqali keshni tozalash uchun)
+STATS_MODELS = (User, Laboratory, Program, Event, Project, Partner, Application, Certificate, News)
+
+
+def _stat_querysets():
+    return {
+        'total_users': User.objects.all(),
+        'total_students': User.objects.filter(role='student'),
+        'total_labs': Laboratory.objects.filter(is_active=True),
+        'total_programs': Program.objects.filter(is_active=True),
+        'total_events': Event.objects.filter(is_active=True),
+        'total_projects': Project.objects.filter(is_active=True),
+        'total_partners': Partner.objects.filter(is_active=True),
+        'total_applications': Application.objects.all(),
+        'pending_applications': Application.objects.filter(status='pending'),
+        'total_news': News.objects.all(),
+        'total_certificates': Certificate.objects.all(),
+    }
+
+
+def compute_stats():
+    """Barcha ko'rsatkichlarni bitta SELECT bilan hisoblash."""
+    querysets = _stat_querysets()
+    columns, params = [], []
+    for name, queryset in querysets.items():
+        sql, query_params = queryset.order_by().values('pk').query.sql_with_params()
+        columns.append(f'(SELECT COUNT(*) FROM ({sql}) AS {name}_q) AS {name}')
+        params.extend(query_params)
+    with connections[router.db_for_read(Application)].cursor() as cursor:
+        cursor.execute('SELECT ' + ', '.join(columns), params)
+        row = cursor.fetchone()
+    return dict(zip(querysets, row))
+
+
+def get_stats():
+    stats = cache.get(DASHBOARD_STATS_KEY)
+    if stats is None:
+        stats = compute_stats()
+        cache.set(DASHBOARD_STATS_KEY, stats, settings.DASHBOARD_STATS_TIMEOUT)
+    return stats
+
+
+def invalidate_stats():
+    cache.delete(DASHBOARD_STATS_KEY)
@@ -0,0 +1,151 @@
+import gzip
+import hashlib
+import os
+import posixpath
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, storages
+from django.utils.functional import cached_property
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+HASH_NAME_LENGTH = 32
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.mjs', '.svg', '.json', '.map', '.txt', '.xml', '.html')
+
+
+def scan_files(root):
+    """
+    Katalog daraxtidagi fayllarni os.scandir bilan oqim sifatida qaytarish (DirEntry).
+    Ro'yxat xotirada yig'ilmaydi — millionlab fayl uchun ham xotira sarfi o'zgarmaydi.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except FileNotFoundError:
+            continue
+
+
+def file_digest(fh):
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: fh.read(1024 * 1024), b''):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def private_storage():
+    """Ommaga ochiq bo'lmagan fayllar saqlagichi (STORAGES['private'])."""
+    return storages['private']
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Fayllar tarkibining SHA-256 xeshi bo'yicha nomlanadi: labs/<xesh>.png.
+    Har bir noyob tarkib MEDIA_BLOB_ROOT da bir marta saqlanadi, MEDIA_ROOT dagi
+    fayllar esa unga qattiq havola (hard link). Bir xil fayl bir necha papkaga
+    yuklansa ham diskda bitta nusxa bo'ladi, URL lar esa o'zgarmas.
+    Hech kim ishlatmayotgan bloblarni manage.py gc_media_blobs o'chiradi.
+    """
+
+    @cached_property
+    def blob_location(self):
+        return os.path.abspath(settings.MEDIA_BLOB_ROOT)
+
+    def blob_path(self, digest):
+        return os.path.join(self.blob_location, digest[:2], digest)
+
+    def get_available_name(self, name, max_length=None):
+        # Nom tarkibdan kelib chiqadi: mavjud fayl aynan shu tarkibning o'zi
+        return name
+
+    def _save(self, name, content):
+        os.makedirs(self.blob_location, exist_ok=True)
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=self.blob_location, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                if hasattr(content, 'seek'):
+                    content.seek(0)
+                for chunk in content.chunks():
+                    digest.update(chunk)
+                    tmp.write(chunk)
+            digest = digest.hexdigest()
+            blob = self.blob_path(digest)
+            if os.path.exists(blob):
+                os.remove(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(blob), exist_ok=True)
+                if self.file_permissions_mode is not None:
+                    os.chmod(tmp_path, self.file_permissions_mode)
+                os.replace(tmp_path, blob)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        directory, filename = posixpath.split(name)
+        ext = posixpath.splitext(filename)[1].lower()
+        name = posixpath.join(directory, digest[:HASH_NAME_LENGTH] + ext)
+        self.link_blob(blob, self.path(name))
+        return name
+
+    def link_blob(self, blob, full_path):
+        if os.path.exists(full_path):
+            return
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        try:
+            os.link(blob, full_path)
+        except FileExistsError:
+            # Parallel yuklama xuddi shu faylni allaqachon yaratgan
+            pass
+        except OSError:
+            # Qattiq havola qo'llanmaydigan fayl tizimi — oddiy nusxa
+            shutil.copyfile(blob, full_path)
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    collectstatic natijasi: xeshli nomlar (landing.3f2a1c.css) va har bir matnli fayl
+    yonida oldindan siqilgan .gz hamda .br nusxalar. Veb-server (nginx gzip_static /
+    brotli_static) yoki static middleware ularni so'rov paytida siqmasdan yuboradi.
+    brotli paketi o'rnatilmagan bo'lsa faqat .gz yaratiladi.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+        names = set(paths) | set(self.hashed_files.values())
+        for name in sorted(names):
+            if name.endswith(COMPRESSIBLE_EXTENSIONS):
+                for compressed in self.compress(name):
+                    yield name, compressed, True
+
+    def compress(self, name):
+        with self.open(name) as fh:
+            content = fh.read()
+        encoders = [('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            encoders.append(('.br', lambda data: brotli.compress(data, quality=11)))
+        for suffix, encode in encoders:
+            data = encode(content)
+            # Foyda sezilarsiz bo'lsa siqilgan nusxa saqlanmaydi
+            if len(data) >= len(content) * 0.95:
+                continue
+            compressed = name + suffix
+            if self.exists(compressed):
+                self.delete(compressed)
+            self._save(compressed, ContentFile(data))
+            yield compressed
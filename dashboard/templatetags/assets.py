@@ -0,0 +1,34 @@
+from django import template
+from django.utils.html import format_html, format_html_join
+
+from dashboard.assets import add_preloads, asset_url, preload_links
+
+register = template.Library()
+
+
+@register.simple_tag
+def asset(key):
+    """
+    Tashqi kutubxona manzili (dashboard.assets.ASSETS):
+
+        <link href="{% asset 'bootstrap-css' %}" rel="stylesheet">
+    """
+    return asset_url(key)
+
+
+@register.simple_tag(takes_context=True)
+def preload_assets(context, group, *stylesheets):
+    """
+    Muhim CSS va shriftlar uchun <link rel="preload"> teglari; xuddi shu ro'yxat
+    Link sarlavhasi sifatida ham yuboriladi.
+
+        {% preload_assets 'app' 'css/dashboard.css' %}
+    """
+    links = preload_links(group, [(path, 'style') for path in stylesheets])
+    request = context.get('request')
+    if request is not None:
+        add_preloads(request, links)
+    return format_html_join(
+        '\n    ', '<link rel="preload" href="{}" as="{}"{}>',
+        ((url, kind, format_html(' type="font/woff2" crossorigin') if kind == 'font' else '') for url, kind in links),
+    )
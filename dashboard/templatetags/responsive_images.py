@@ -0,0 +1,43 @@
+from django import template
+from django.forms.utils import flatatt
+from django.utils.html import format_html
+
+from dashboard.images import get_manifest, variant_name, variant_storage
+
+register = template.Library()
+
+
+def _srcset(name, widths, ext):
+    return ', '.join(f'{variant_storage.url(variant_name(name, width, ext))} {width}w' for width in widths)
+
+
+@register.simple_tag
+def responsive_image(image, sizes='100vw', dimensions=True, **attrs):
+    """
+    ImageField uchun WebP va JPEG srcset'li <picture>.
+    Variantlar hali tayyor bo'lmasa asl faylga ishora qiluvchi oddiy <img> qaytariladi.
+
+        {% responsive_image program.image sizes="40px" class="table-img" alt="" %}
+    """
+    if not image:
+        return ''
+    attrs.setdefault('loading', 'lazy')
+    attrs.setdefault('decoding', 'async')
+    manifest = get_manifest(image.name)
+    if manifest is None:
+        return format_html('<img src="{}"{}>', image.url, flatatt(attrs))
+
+    widths = manifest['widths']
+    largest = widths[-1]
+    if dimensions:
+        attrs['width'] = largest
+        attrs['height'] = round(manifest['height'] * largest / manifest['width'])
+    return format_html(
+        '<picture style="display: contents;">'
+        '<source type="image/webp" srcset="{}" sizes="{}">'
+        '<img src="{}" srcset="{}" sizes="{}"{}>'
+        '</picture>',
+        _srcset(image.name, widths, 'webp'), sizes,
+        variant_storage.url(variant_name(image.name, largest, 'jpg')),
+        _srcset(image.name, widths, 'jpg'), sizes, flatatt(attrs),
+    )
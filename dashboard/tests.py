@@ -1,3 +1,760 @@
-from django.test import TestCase
+import base64
+import gzip
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from io import BytesIO, StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.db import connection, connections, transaction
+from django.http import HttpResponse, QueryDict
+from django.template import Context, Template
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import urlencode
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTFont
+from PIL import Image
+
+from accounts.models import User
+from . import assets, bulk, cache as reference_cache
+from .checks import search_triggers_check
+from .cache import IMAGES_VERSION, get_version
+from .compression import CompressionMiddleware, choose_encoding, minify_html
+from .db import PIN_COOKIE, DatabaseRoutingMiddleware
+from .images import process_image, variant_base
+from .jobs import release_stale_jobs
+from .models import Application, Certificate, Event, ImageJob, Laboratory, News, Program, Project, SiteSetting
+from .pagination import RankedPage, keyset_paginate
+from .search import missing_search_triggers, ranked
+from .signals import applications_changed
+from .static import StaticFilesMiddleware
+from .workers import worker_pool
+
+def _worker_connection_state():
+    # Bola jarayonda: ota jarayondan ochiq ulanish meros qolganmi
+    return os.getpid(), connections['default'].connection is not None
+
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+class IsolatedMediaMixin:
+    """Media, blob ombori va kesh har bir test uchun vaqtinchalik papkada."""
+
+    def setUp(self):
+        super().setUp()
+        self.media_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_dir, ignore_errors=True)
+        storages = {
+            **settings.STORAGES,
+            'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+        }
+        override = override_settings(
+            MEDIA_ROOT=f'{self.media_dir}/media',
+            MEDIA_BLOB_ROOT=f'{self.media_dir}/blobs',
+            STORAGES=storages,
+            CACHES=LOCMEM_CACHE,
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+        cache.clear()
+
+    def jpeg(self, size=(400, 300), exif_tags=None):
+        exif = Image.Exif()
+        exif.update(exif_tags or {})
+        buffer = BytesIO()
+        Image.new('RGB', size, 'red').save(buffer, 'JPEG', exif=exif)
+        return ContentFile(buffer.getvalue())
+
+
+class HotQueryIndexTests(TestCase):
+    """Har bir ko'p ishlatiladigan so'rov o'z indeksidan foydalanadi (EXPLAIN QUERY PLAN)."""
+
+    def plan(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+            return ' | '.join(row[-1] for row in cursor.fetchall())
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = self.plan(queryset)
+        self.assertIn(f'USING INDEX {index_name}', plan)
+        # Tartiblash ham indeksdan olinadi, alohida saralash bo'lmaydi
+        self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_application_list_by_status(self):
+        self.assertUsesIndex(
+            Application.objects.filter(status='pending').order_by('-created_at', '-pk')[:26],
+            'application_status_created_idx',
+        )
+
+    def test_application_list(self):
+        self.assertUsesIndex(Application.objects.order_by('-created_at', '-pk')[:26], 'application_created_idx')
+
+    def test_application_user_program_lookup(self):
+        plan = self.plan(Application.objects.filter(user_id=1, program_id=1))
+        self.assertRegex(plan, r'USING (COVERING )?INDEX \S+ \(user_id=\? AND program_id=\?\)')
+
+    def test_active_programs(self):
+        self.assertUsesIndex(Program.objects.filter(is_active=True)[:4], 'program_active_created_idx')
+
+    def test_upcoming_events(self):
+        self.assertUsesIndex(
+            Event.objects.filter(is_active=True, date__gte=timezone.now())[:4], 'event_active_date_idx',
+        )
+
+    def test_published_news(self):
+        self.assertUsesIndex(News.objects.filter(is_published=True)[:3], 'news_published_created_idx')
+
+    def test_approved_projects(self):
+        self.assertUsesIndex(
+            Project.objects.filter(is_active=True, is_approved=True)[:6], 'project_approved_created_idx',
+        )
+
+    def test_user_list(self):
+        self.assertUsesIndex(User.objects.order_by('-date_joined', '-pk')[:26], 'user_date_joined_idx')
+
+
+class ImageProcessingTests(IsolatedMediaMixin, TestCase):
+
+    def test_stripped_copy_replaces_original(self):
+        # 0x010F — kamera ishlab chiqaruvchisi (EXIF)
+        name = default_storage.save('news/photo.jpg', self.jpeg(exif_tags={0x010F: 'Camera'}))
+        news = News.objects.create(title='T', slug='t', content='c', image=name)
+        version = get_version(IMAGES_VERSION)
+
+        manifest = process_image(name)
+
+        news.refresh_from_db()
+        self.assertNotEqual(news.image.name, name)
+        self.assertFalse(default_storage.exists(name))
+        with default_storage.open(news.image.name) as fh:
+            self.assertFalse(Image.open(fh).getexif())
+        self.assertIsNotNone(manifest)
+        # Sahifa keshlari versiyasini partiya oxirida buyruq almashtiradi
+        self.assertEqual(get_version(IMAGES_VERSION), version)
+
+    def test_build_command_bumps_images_version_once(self):
+        # Blob ombori bir xil tarkibni bitta faylga yozadi — har biri boshqa o'lchamda
+        for index, slug in enumerate('abc'):
+            image = default_storage.save(f'news/{slug}.jpg', self.jpeg(size=(400 + index, 300)))
+            News.objects.create(title=slug, slug=slug, content='c', image=image)
+
+        with mock.patch('dashboard.images.invalidate_version') as bump:
+            call_command('build_image_variants', stdout=StringIO())
+        bump.assert_called_once_with(IMAGES_VERSION)
+
+        # Hamma variant tayyor — hech narsa yaratilmadi, versiya ham o'zgarmaydi
+        with mock.patch('dashboard.images.invalidate_version') as bump:
+            call_command('build_image_variants', stdout=StringIO())
+        bump.assert_not_called()
+
+    def test_job_batch_bumps_images_version_once(self):
+        for index, slug in enumerate('abc'):
+            ImageJob.objects.create(name=default_storage.save(f'news/{slug}.jpg', self.jpeg(size=(400 + index, 300))))
+
+        # Jarayonlar o'rniga oqimlar: spawn qilingan bola test bazasi va sozlamalarini ko'rmaydi
+        with mock.patch('dashboard.management.commands.process_image_jobs.worker_pool', ThreadPoolExecutor), \
+                mock.patch('dashboard.images.invalidate_version') as bump:
+            call_command('process_image_jobs', '--once', '--workers=2', stdout=StringIO())
+
+        bump.assert_called_once_with(IMAGES_VERSION)
+        self.assertEqual(set(ImageJob.objects.values_list('status', flat=True)), {'done'})
+
+    def render_image(self, image):
+        template = Template('{% load responsive_images %}{% responsive_image image sizes="(min-width: 800px) 50vw, 100vw" alt="" %}')
+        return template.render(Context({'image': image}))
+
+    @override_settings(IMAGE_VARIANT_WIDTHS=[160, 320, 640])
+    def test_responsive_image_tag(self):
+        news = News.objects.create(title='T', slug='t', content='c', image=default_storage.save('news/p.jpg', self.jpeg()))
+        process_image(news.image.name)
+
+        html = self.render_image(news.image)
+
+        base = settings.MEDIA_URL + variant_base(news.image.name)
+        sizes = 'sizes="(min-width: 800px) 50vw, 100vw"'
+        # 640 asl kenglikdan (400) katta — variantlar faqat 160 va 320
+        self.assertIn(f'<source type="image/webp" srcset="{base}/160.webp 160w, {base}/320.webp 320w" {sizes}>', html)
+        self.assertIn(f'<img src="{base}/320.jpg" srcset="{base}/160.jpg 160w, {base}/320.jpg 320w" {sizes}', html)
+        self.assertIn(' alt="" decoding="async" height="240" loading="lazy" width="320"></picture>', html)
+
+    def test_responsive_image_without_manifest_falls_back_to_img(self):
+        news = News.objects.create(title='T', slug='t', content='c', image=default_storage.save('news/p.jpg', self.jpeg()))
+
+        html = self.render_image(news.image)
+
+        self.assertEqual(html, f'<img src="{news.image.url}" alt="" decoding="async" loading="lazy">')
+        self.assertEqual(self.render_image(News().image), '')
+
+    def test_release_stale_jobs_keeps_recent_claims(self):
+        ImageJob.objects.create(name='a.jpg', status='processing')
+        stale = ImageJob.objects.create(name='b.jpg', status='processing')
+        ImageJob.objects.filter(pk=stale.pk).update(
+            updated_at=timezone.now() - timedelta(seconds=settings.IMAGE_JOB_STALE_SECONDS + 1),
+        )
+
+        self.assertEqual(release_stale_jobs(), 1)
+        self.assertEqual(
+            dict(ImageJob.objects.values_list('name', 'status')),
+            {'a.jpg': 'processing', 'b.jpg': 'pending'},
+        )
+
+
+class ImageWorkerPoolTests(SimpleTestCase):
+    databases = {'default'}
+
+    def test_worker_opens_its_own_connection(self):
+        # Ota jarayonda ulanish ochiq — fork qilinganda aynan shu ulanish bolaga o'tardi
+        connections['default'].ensure_connection()
+
+        with worker_pool(1) as pool:
+            pid, inherited = pool.submit(_worker_connection_state).result(timeout=60)
+
+        self.assertNotEqual(pid, os.getpid())
+        self.assertFalse(inherited)
+
+
+class ContentAddressedStorageTests(IsolatedMediaMixin, TestCase):
+
+    def gc(self):
+        call_command('gc_media_blobs', min_age=0, stdout=StringIO())
+
+    def test_identical_uploads_share_one_blob(self):
+        content = self.jpeg().read()
+        news_name = default_storage.save('news/a.jpg', ContentFile(content))
+        program_name = default_storage.save('programs/b.jpg', ContentFile(content))
+
+        self.assertEqual(os.path.basename(news_name), os.path.basename(program_name))
+        news_stat = os.stat(default_storage.path(news_name))
+        self.assertEqual(news_stat.st_ino, os.stat(default_storage.path(program_name)).st_ino)
+        # Ikki media havola + ombordagi blob
+        self.assertEqual(news_stat.st_nlink, 3)
+
+    def test_gc_keeps_blob_still_used_by_another_row(self):
+        content = self.jpeg().read()
+        news = News.objects.create(
+            title='T', slug='t', content='c', image=default_storage.save('news/a.jpg', ContentFile(content)),
+        )
+        program = Program.objects.create(
+            name='P', image=default_storage.save('programs/a.jpg', ContentFile(content)),
+        )
+        blob_dir = os.path.join(
+            settings.MEDIA_BLOB_ROOT, os.path.basename(program.image.name)[:2],
+        )
+
+        # Birinchi yozuv va uning fayli o'chiriladi — blob ikkinchisi uchun qolishi kerak
+        default_storage.delete(news.image.name)
+        news.delete()
+        self.gc()
+        with default_storage.open(program.image.name) as fh:
+            self.assertEqual(fh.read(), content)
+        self.assertEqual(len(os.listdir(blob_dir)), 1)
+
+        default_storage.delete(program.image.name)
+        program.delete()
+        self.gc()
+        self.assertEqual(os.listdir(blob_dir), [])
+
+
+class CompressionTests(SimpleTestCase):
+
+    def respond(self, html, accept_encoding='gzip', **headers):
+        middleware = CompressionMiddleware(lambda request: HttpResponse(html, headers=headers))
+        return middleware(RequestFactory().get('/', HTTP_ACCEPT_ENCODING=accept_encoding))
+
+    def test_minify_keeps_attributes_and_code(self):
+        html = '<p   title="a   b" data-x="1 > 2">  x   <code>a   b</code>\n\n  <!-- izoh -->  y</p>'
+        self.assertEqual(
+            minify_html(html),
+            '<p   title="a   b" data-x="1 > 2"> x <code>a   b</code>\n y</p>',
+        )
+
+    def test_gzip_length_is_randomized(self):
+        html = '<p>' + 'salom ' * 100 + '</p>'
+        responses = [self.respond(html) for _ in range(5)]
+        for response in responses:
+            self.assertEqual(response['Content-Encoding'], 'gzip')
+            self.assertEqual(gzip.decompress(response.content).decode(), minify_html(html))
+        self.assertGreater(len({len(response.content) for response in responses}), 1)
+
+    def test_no_transform_is_left_untouched(self):
+        html = '<p>   ' + 'salom   ' * 100 + '</p>'
+        response = self.respond(html, **{'Cache-Control': 'public, no-transform'})
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content.decode(), html)
+
+    def test_choose_encoding_honours_q_values(self):
+        self.assertEqual(choose_encoding('br;q=0, gzip'), 'gzip')
+        self.assertEqual(choose_encoding('gzip;q=0.5, br;q=0.8'), 'br')
+        self.assertEqual(choose_encoding('br;q=0.4, gzip;q=0.9'), 'gzip')
+        self.assertEqual(choose_encoding('GZIP; Q=0'), None)
+        self.assertEqual(choose_encoding('*;q=0.1, br;q=0'), 'gzip')
+        self.assertEqual(choose_encoding('identity'), None)
+        self.assertEqual(choose_encoding(''), None)
+
+    def test_refused_encoding_is_not_sent(self):
+        html = '<p>' + 'salom ' * 100 + '</p>'
+        response = self.respond(html, accept_encoding='br;q=0, gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        response = self.respond(html, accept_encoding='gzip;q=0')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+
+class StaticFilesMiddlewareTests(SimpleTestCase):
+    CSS = b'body { color: red; }' * 20
+
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        for name, content in (('app.css', self.CSS), ('app.css.gz', b'gz'), ('app.css.br', b'br')):
+            Path(root, name).write_bytes(content)
+        with override_settings(DEBUG=False, STATIC_ROOT=root, STATIC_URL='/static/'):
+            self.middleware = StaticFilesMiddleware(lambda request: HttpResponse(status=404))
+
+    def get(self, accept_encoding='', **headers):
+        return self.middleware(RequestFactory().get('/static/app.css', HTTP_ACCEPT_ENCODING=accept_encoding, headers=headers))
+
+    def test_encoding_choice(self):
+        cases = {
+            '': (None, self.CSS),
+            'gzip, br': ('br', b'br'),
+            'br;q=0, gzip': ('gzip', b'gz'),
+            # Substring emas, token bo'yicha: x-brotli — br emas
+            'x-brotli': (None, self.CSS),
+            'gzip;q=0.9, br;q=0.5': ('gzip', b'gz'),
+            'br;q=0, gzip;q=0': (None, self.CSS),
+        }
+        for accept_encoding, (encoding, body) in cases.items():
+            with self.subTest(accept_encoding=accept_encoding):
+                response = self.get(accept_encoding)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.get('Content-Encoding'), encoding)
+                self.assertEqual(response.content, body)
+                self.assertEqual(response['Vary'], 'Accept-Encoding')
+
+    def test_not_modified(self):
+        first = self.get('gzip')
+        self.assertEqual(self.get('gzip', If_None_Match=first['ETag']).status_code, 304)
+        # Boshqa kodlashdagi nusxaning ETag'i boshqa
+        self.assertEqual(self.get('', If_None_Match=first['ETag']).status_code, 200)
+        self.assertEqual(self.get('', If_Modified_Since=first['Last-Modified']).status_code, 304)
+
+    def test_range(self):
+        # Range so'rovida siqilgan nusxa tanlanmaydi — baytlar asl fayldan
+        response = self.get('br, gzip', Range='bytes=5-9')
+        self.assertEqual(response.status_code, 206)
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, self.CSS[5:10])
+        self.assertEqual(response['Content-Range'], f'bytes 5-9/{len(self.CSS)}')
+
+        response = self.get(Range=f'bytes={len(self.CSS)}-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(self.CSS)}')
+
+
+class KeysetPaginationTests(TestCase):
+
+    def setUp(self):
+        self.programs = [Program.objects.create(name=f'Dastur {index}') for index in range(7)]
+        now = timezone.now()
+        # Uchtasi bir xil vaqtda — tartibni pk hal qiladi
+        for index, program in enumerate(self.programs):
+            Program.objects.filter(pk=program.pk).update(created_at=now - timedelta(minutes=min(index, 3)))
+        self.expected = list(Program.objects.order_by('-created_at', '-pk').values_list('pk', flat=True))
+
+    def page(self, query=''):
+        request = RequestFactory().get(f'/?{query}')
+        return keyset_paginate(request, Program.objects.all(), per_page=3)
+
+    def test_cursor_round_trip_with_ties(self):
+        pages = [self.page('status=active')]
+        while pages[-1].has_next:
+            pages.append(self.page(pages[-1].next_query))
+        self.assertEqual([program.pk for page in pages for program in page], self.expected)
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertFalse(pages[0].has_previous)
+
+        # Orqaga yurilganda ham aynan o'sha sahifalar
+        back = [pages[-1]]
+        while back[-1].has_previous:
+            back.append(self.page(back[-1].previous_query))
+        self.assertEqual(
+            [[program.pk for program in page] for page in reversed(back)],
+            [[program.pk for program in page] for page in pages],
+        )
+        self.assertTrue(back[-1].has_next)
+
+    def test_filters_are_kept_in_page_links(self):
+        first = self.page('status=active&search=robot&after=eski')
+        query = QueryDict(first.next_query)
+        self.assertEqual(query['status'], 'active')
+        self.assertEqual(query['search'], 'robot')
+        self.assertEqual(query.getlist('after'), [query['after']])
+        self.assertNotIn('before', query)
+
+        second = self.page(first.next_query)
+        query = QueryDict(second.previous_query)
+        self.assertEqual((query['status'], query['search']), ('active', 'robot'))
+        self.assertNotIn('after', query)
+
+    def test_invalid_cursor_falls_back_to_first_page(self):
+        first = [program.pk for program in self.page()]
+
+        def encode(value):
+            return base64.urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip('=')
+
+        for cursor in ('@@@', 'YWJj', encode('ab'), encode([None, 1]), encode([1, 2, 3]), encode(['sana emas', 1])):
+            for param in ('after', 'before'):
+                with self.subTest(param=param, cursor=cursor):
+                    page = self.page(urlencode({param: cursor}))
+                    self.assertEqual([program.pk for program in page], first)
+                    self.assertFalse(page.has_previous)
+
+    def test_ranked_page_links(self):
+        request = RequestFactory().get('/?q=robot&page=2')
+        page = RankedPage(request, [], 2, has_next=True)
+        self.assertEqual(page.next_query, 'q=robot&page=3')
+        self.assertEqual(page.previous_query, 'q=robot&page=1')
+        self.assertEqual(RankedPage(request, [], 1, has_next=False).previous_query, '')
+
+
+class DatabaseRoutingTests(TestCase):
+    databases = {'default', 'replica'}
+
+    def respond(self, view, method='get'):
+        middleware = DatabaseRoutingMiddleware(view)
+        return middleware(getattr(RequestFactory(), method)('/'))
+
+    def test_committed_write_pins_primary(self):
+        def view(request):
+            with self.captureOnCommitCallbacks(execute=True):
+                Program.objects.create(name='Robototexnika')
+            return HttpResponse()
+
+        self.assertIn(PIN_COOKIE, self.respond(view).cookies)
+
+    def test_lookup_and_rolled_back_write_do_not_pin(self):
+        Program.objects.create(name='Robototexnika')
+
+        def view(request):
+            with self.captureOnCommitCallbacks(execute=True):
+                # Topilgan yozuv — db_for_write chaqiriladi, lekin hech narsa yozilmaydi
+                Program.objects.get_or_create(name='Robototexnika')
+                try:
+                    with transaction.atomic():
+                        Program.objects.create(name='Bekor')
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+            return HttpResponse()
+
+        self.assertNotIn(PIN_COOKIE, self.respond(view).cookies)
+
+    def test_post_always_pins_primary(self):
+        self.assertIn(PIN_COOKIE, self.respond(lambda request: HttpResponse(), method='post').cookies)
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class BulkApplicationTests(TestCase):
+
+    def setUp(self):
+        self.program = Program.objects.create(name='Robototexnika')
+        self.applications = {
+            status: [
+                Application.objects.create(
+                    user=User.objects.create_user(f'{status}{index}', password='parol12345'),
+                    program=self.program, status=status,
+                )
+                for index in range(2)
+            ]
+            for status in bulk.STATUSES
+        }
+
+    def test_set_status_counts_moved_applications(self):
+        changed = []
+
+        def receiver(sender, user_ids, **kwargs):
+            changed.extend(user_ids)
+
+        applications_changed.connect(receiver)
+        self.addCleanup(applications_changed.disconnect, receiver)
+
+        moved = bulk.set_status(Application.objects.all(), 'approved')
+
+        self.assertEqual(moved, {'pending': 2, 'rejected': 2})
+        self.assertEqual(Application.objects.filter(status='approved').count(), 6)
+        # Holati o'zgarmagan (allaqachon tasdiqlangan) talabalar keshiga tegilmaydi
+        moved_users = {app.user_id for status in ('pending', 'rejected') for app in self.applications[status]}
+        self.assertEqual(set(changed), moved_users)
+        self.assertEqual(bulk.set_status(Application.objects.all(), 'approved'), {})
+
+    def test_issue_certificates_only_for_approved_once(self):
+        approved = self.applications['approved']
+        Certificate.objects.create(
+            user=approved[0].user, program=self.program, title='Robototexnika',
+            certificate_id='QOLDA-1', issued_date=timezone.localdate(),
+        )
+
+        self.assertEqual(bulk.issue_certificates(Application.objects.all()), 1)
+        self.assertEqual(
+            set(Certificate.objects.values_list('user_id', 'certificate_id')),
+            {(approved[0].user_id, 'QOLDA-1'), (approved[1].user_id, f'APP-{approved[1].pk}')},
+        )
+        # Qayta bosilganda yangi sertifikat yaratilmaydi
+        self.assertEqual(bulk.issue_certificates(Application.objects.all()), 0)
+
+    def test_approve_filtered_selection_issues_certificates(self):
+        admin = User.objects.create_user('admin', password='parol12345', role='admin')
+        self.client.force_login(admin)
+        pending = self.applications['pending']
+
+        response = self.client.post(reverse('dashboard:application_bulk'), {
+            'scope': 'filter', 'status': 'pending', 'status_action': 'approved', 'issue_certificates': '1',
+        })
+
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Application.objects.filter(status='pending').exists())
+        # Faqat filtrga mos (avval kutilayotgan) arizalar egalariga — UPDATE dan keyin ham
+        self.assertEqual(
+            set(Certificate.objects.values_list('certificate_id', flat=True)),
+            {f'APP-{application.pk}' for application in pending},
+        )
+        self.assertEqual(bulk.approve(Application.objects.filter(pk=pending[0].pk), issue=True), ({}, 0))
+
+
+def _icon_font(codepoints):
+    """Berilgan belgilar uchun bo'sh gliflardan iborat woff2 shrift."""
+    names = ['.notdef', *[f'icon{code:x}' for code in codepoints]]
+    builder = FontBuilder(1000)
+    builder.setupGlyphOrder(names)
+    builder.setupCharacterMap({code: f'icon{code:x}' for code in codepoints})
+    builder.setupGlyf({name: TTGlyphPen(None).glyph() for name in names})
+    builder.setupHorizontalMetrics({name: (500, 0) for name in names})
+    builder.setupHorizontalHeader()
+    builder.setupNameTable({'familyName': 'Icons', 'styleName': 'Regular'})
+    builder.setupOS2()
+    builder.setupPost()
+    builder.font.flavor = 'woff2'
+    output = BytesIO()
+    builder.save(output)
+    return output.getvalue()
+
+
+class VendorAssetsTests(TestCase):
+    FONT_CSS = (
+        "/* cyrillic */\n@font-face {\n  font-family: 'Inter';\n  font-weight: 400;\n"
+        "  src: url(https://fonts.example/inter-cyr.woff2) format('woff2');\n}\n"
+        "/* latin */\n@font-face {\n  font-family: 'Inter';\n  font-weight: 400;\n"
+        "  src: url(https://fonts.example/inter-lat.woff2) format('woff2');\n}\n"
+        "/* latin */\n@font-face {\n  font-family: 'Space Grotesk';\n  font-weight: 400;\n"
+        "  src: url(https://fonts.example/grotesk-lat.woff2) format('woff2');\n}\n"
+        "/* vietnamese */\n@font-face {\n  font-family: 'Inter';\n  font-weight: 400;\n"
+        "  src: url(https://fonts.example/inter-vi.woff2) format('woff2');\n}\n"
+    )
+
+    def setUp(self):
+        self.static_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.static_dir, ignore_errors=True)
+        # Buyruq birinchi papkaga yozadi; loyihaning o'z static fayllari ham ko'rinib turadi
+        override = override_settings(
+            STATICFILES_DIRS=[self.static_dir, *settings.STATICFILES_DIRS],
+            STORAGES={
+                **settings.STORAGES,
+                'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+            },
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+        for cached in (finders.get_finder, assets.is_vendored, assets.vendor_preloads):
+            cached.cache_clear()
+            self.addCleanup(cached.cache_clear)
+
+        from dashboard.management.commands import vendor_assets
+        self.command = vendor_assets
+        self.responses = {
+            url: b'body{}\n/*# sourceMappingURL=x.map */' for path, url in assets.ASSETS.values()
+        }
+        self.responses.update({
+            assets.ASSETS['fonts-landing'][1]: self.FONT_CSS.encode(),
+            assets.ASSETS['fonts-app'][1]: self.FONT_CSS.encode(),
+            vendor_assets.ICONS_CSS_URL: (
+                '@font-face { font-family: "bootstrap-icons"; src: url("./fonts/bootstrap-icons.woff2") format("woff2"); }\n'
+                '.bi-geo-alt::before { content: "\\f3e8"; }\n'
+                '.bi-unused-icon::before { content: "\\f101"; }\n'
+            ).encode(),
+            vendor_assets.ICONS_FONT_URL: _icon_font([0xf3e8, 0xf101]),
+            **{
+                f'https://fonts.example/{name}.woff2': b'wOF2'
+                for name in ('inter-cyr', 'inter-lat', 'grotesk-lat')
+            },
+        })
+
+    def run_command(self):
+        # Tarmoq o'rniga tayyor javoblar; ro'yxatda yo'q manzil KeyError beradi
+        with mock.patch.object(self.command, 'fetch', side_effect=self.responses.__getitem__):
+            call_command('vendor_assets', stdout=StringIO())
+
+    def test_writes_files_and_preload_manifest(self):
+        self.run_command()
+        root = Path(self.static_dir, assets.VENDOR_DIR)
+
+        self.assertEqual((root / 'bootstrap/bootstrap.min.css').read_text(), 'body{}\n')
+        self.assertEqual(
+            sorted(path.name for path in (root / 'fonts').iterdir()),
+            ['app.css', 'inter-cyrillic.woff2', 'inter-latin.woff2', 'landing.css', 'space-grotesk-latin.woff2'],
+        )
+        self.assertEqual(
+            assets.preload_links('landing'),
+            [
+                ('/static/vendor/bootstrap/bootstrap.min.css', 'style'),
+                ('/static/vendor/fonts/landing.css', 'style'),
+                ('/static/vendor/fonts/inter-latin.woff2', 'font'),
+                ('/static/vendor/bootstrap-icons/bootstrap-icons.woff2', 'font'),
+                ('/static/css/landing.css', 'style'),
+            ],
+        )
+
+    def test_icon_font_is_subset_to_used_icons(self):
+        self.run_command()
+        icons = Path(self.static_dir, assets.VENDOR_DIR, 'bootstrap-icons')
+
+        css = (icons / 'bootstrap-icons.css').read_text()
+        self.assertIn('.bi-geo-alt::before', css)
+        self.assertNotIn('bi-unused-icon', css)
+        font = TTFont(icons / 'bootstrap-icons.woff2')
+        self.assertEqual(font.flavor, 'woff2')
+        self.assertEqual(set(font.getBestCmap()), {0xf3e8})
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ReferenceCacheTests(TestCase):
+
+    def setUp(self):
+        reference_cache.reset_stats()
+        self.addCleanup(reference_cache.reset_stats)
+
+    def test_read_through_queries_once(self):
+        Laboratory.objects.create(name='Robototexnika')
+        with self.assertNumQueries(1):
+            self.assertEqual([lab.name for lab in reference_cache.get_laboratories()], ['Robototexnika'])
+        with self.assertNumQueries(0):
+            reference_cache.get_laboratories()
+
+    def test_hits_and_misses_are_flushed(self):
+        with mock.patch.object(reference_cache, 'STATS_FLUSH_EVERY', 1):
+            for _ in range(3):
+                reference_cache.get_partners()
+        self.assertEqual(reference_cache.get_stats()['partners'], {'hits': 2, 'misses': 1})
+
+    def test_model_signals_invalidate_reference_data(self):
+        lab = Laboratory.objects.create(name='Robototexnika')
+        reference_cache.get_laboratories()
+        version = reference_cache.get_version('laboratories')
+
+        lab.is_active = False
+        lab.save()
+        self.assertNotEqual(reference_cache.get_version('laboratories'), version)
+        self.assertEqual(reference_cache.get_laboratories(), [])
+
+        SiteSetting.get_settings()
+        settings_row = reference_cache.get_site_settings()
+        SiteSetting.objects.filter(pk=settings_row.pk).update(site_name='Eski')
+        # update() signal chaqirmaydi — kesh eski qiymatni beradi, save() esa tozalaydi
+        self.assertNotEqual(reference_cache.get_site_settings().site_name, 'Eski')
+        settings_row.site_name = 'Yangi'
+        settings_row.save()
+        self.assertEqual(reference_cache.get_site_settings().site_name, 'Yangi')
+
+    def test_pending_count_follows_application_changes(self):
+        user = User.objects.create_user('talaba', password='parol12345')
+        program = Program.objects.create(name='Robototexnika')
+        self.assertEqual(reference_cache.get_pending_count(), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            application = Application.objects.create(user=user, program=program)
+        self.assertEqual(reference_cache.get_pending_count(), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            application.message = 'Izoh'
+            application.save()
+        # Holat o'zgarmagan — hisoblagich qayta sanalmaydi
+        with self.assertNumQueries(0):
+            self.assertEqual(reference_cache.get_pending_count(), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            application.status = 'approved'
+            application.save()
+        self.assertEqual(reference_cache.get_pending_count(), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            pending = Application.objects.create(user=user, program=Program.objects.create(name='Dron'))
+        self.assertEqual(reference_cache.get_pending_count(), 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            pending.delete()
+        self.assertEqual(reference_cache.get_pending_count(), 0)
+
+
+class SearchIndexTests(TestCase):
+
+    def search(self, queryset, query, page=1):
+        request = RequestFactory().get('/', {'page': page})
+        return [obj.pk for obj in ranked(request, queryset, query).object_list]
+
+    def test_insert_update_delete_are_indexed(self):
+        lab = Laboratory.objects.create(name='Robototexnika', description='Arduino va sensorlar')
+        self.assertEqual(self.search(Laboratory.objects.all(), 'arduino'), [lab.pk])
+
+        lab.description = 'Dron va aviamodellar'
+        lab.save()
+        self.assertEqual(self.search(Laboratory.objects.all(), 'arduino'), [])
+        self.assertEqual(self.search(Laboratory.objects.all(), 'dron'), [lab.pk])
+
+        lab.delete()
+        self.assertEqual(self.search(Laboratory.objects.all(), 'dron'), [])
+
+    def test_ranked_orders_by_relevance_within_filters(self):
+        weak = Laboratory.objects.create(name='Fizika', description='Uzun tavsif: optika, mexanika va bir oz robot')
+        strong = Laboratory.objects.create(name='Robot', description='Robot robot')
+        hidden = Laboratory.objects.create(name='Robot', description='Robot robot robot', is_active=False)
+
+        self.assertEqual(self.search(Laboratory.objects.all(), 'robot'), [hidden.pk, strong.pk, weak.pk])
+        # Filtr LIMIT dan oldin qo'llanadi: faol bo'lmagan eng kuchli natija chiqmaydi
+        self.assertEqual(self.search(Laboratory.objects.filter(is_active=True), 'robot'), [strong.pk, weak.pk])
+
+    def test_ranked_paginates(self):
+        labs = [Laboratory.objects.create(name=f'Robot {index}') for index in range(3)]
+        request = RequestFactory().get('/', {'page': 2, 'q': 'robot'})
+        page = ranked(request, Laboratory.objects.all(), 'robot', per_page=2)
+        self.assertEqual(len(page.object_list), 1)
+        self.assertFalse(page.has_next)
+        self.assertEqual(page.previous_query, 'page=1&q=robot')
+        self.assertIn(page.object_list[0].pk, [lab.pk for lab in labs])
+
+    def test_check_reports_dropped_triggers(self):
+        self.assertEqual(search_triggers_check(None, databases=['default']), [])
+        # Jadval qayta qurilgandagi holat: trigger yo'q
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TRIGGER dashboard_laboratory_search_au')
+        self.assertEqual(missing_search_triggers(), ['dashboard_laboratory_search_au'])
+        self.assertEqual([error.id for error in search_triggers_check(None, databases=['default'])], ['dashboard.E001'])
+
+        call_command('rebuild_search_index', stdout=StringIO())
+        self.assertEqual(missing_search_triggers(), [])
+        lab = Laboratory.objects.create(name='Kimyo')
+        lab.name = 'Biologiya'
+        lab.save()
+        self.assertEqual(self.search(Laboratory.objects.all(), 'biologiya'), [lab.pk])
@@ -39,6 +39,7 @@ urlpatterns = [
 
     # Applications
     path('applications/', views.application_list, name='application_list'),
+    path('applications/bulk/', views.application_bulk, name='application_bulk'),
     path('applications/<int:pk>/status/', views.application_status, name='application_status'),
     path('applications/<int:pk>/delete/', views.application_delete, name='application_delete'),
 
@@ -62,4 +63,7 @@ urlpatterns = [
 
     # Settings
     path('settings/', views.site_settings, name='site_settings'),
+
+    # Image jobs
+    path('image-jobs/status/', views.image_job_status, name='image_job_status'),
 ]
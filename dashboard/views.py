@@ -1,4 +1,6 @@
+from django.http import JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404
+from django.urls import reverse
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
@@ -15,6 +17,10 @@ from .forms import (
     PartnerForm, CertificateForm, NewsForm, UserForm, UserCreateForm,
     SiteSettingForm
 )
+from . import bulk, search as search_index
+from .jobs import image_jobs_for, job_statuses
+from .pagination import keyset_paginate
+from .stats import get_stats
 
 
 def admin_required(view_func):
@@ -62,17 +68,7 @@ def admin_logout(request):
 @admin_required
 def dashboard_home(request):
     context = {
-        'total_users': User.objects.count(),
-        'total_students': User.objects.filter(role='student').count(),
-        'total_labs': Laboratory.objects.filter(is_active=True).count(),
-        'total_programs': Program.objects.filter(is_active=True).count(),
-        'total_events': Event.objects.filter(is_active=True).count(),
-        'total_projects': Project.objects.filter(is_active=True).count(),
-        'total_partners': Partner.objects.filter(is_active=True).count(),
-        'total_applications': Application.objects.count(),
-        'pending_applications': Application.objects.filter(status='pending').count(),
-        'total_news': News.objects.count(),
-        'total_certificates': Certificate.objects.count(),
+        **get_stats(),
         'recent_applications': Application.objects.select_related('user', 'program')[:5],
         'recent_news': News.objects.all()[:5],
         'upcoming_events': Event.objects.filter(date__gte=timezone.now(), is_active=True)[:5],
@@ -85,12 +81,17 @@ def dashboard_home(request):
 def generic_list(request, model, template, context_name, order_by='-created_at'):
     items = model.objects.all()
     search = request.GET.get('search', '')
+    if search and search_index.is_indexed(model):
+        # Qidiruv natijalari moslik bo'yicha tartiblanadi va ?page=N bilan sahifalanadi
+        page = search_index.ranked(request, items, search)
+        return render(request, template, {context_name: page.object_list, 'page_obj': page, 'search': search})
     if search:
         if hasattr(model, 'name'):
             items = items.filter(name__icontains=search)
         elif hasattr(model, 'title'):
             items = items.filter(title__icontains=search)
-    return render(request, template, {context_name: items, 'search': search})
+    page = keyset_paginate(request, items, order_by)
+    return render(request, template, {context_name: page.object_list, 'page_obj': page, 'search': search})
 
 
 def generic_create(request, form_class, template, redirect_url, success_msg):
@@ -113,7 +114,7 @@ def generic_edit(request, model, pk, form_class, template, redirect_url, success
             form.save()
             messages.success(request, success_msg)
             return redirect(redirect_url)
-    return render(request, template, {'form': form, 'object': obj})
+    return render(request, template, {'form': form, 'object': obj, 'image_jobs': image_jobs_for(obj)})
 
 
 def generic_delete(request, model, pk, redirect_url, success_msg):
@@ -217,7 +218,12 @@ def partner_list(request):
     search = request.GET.get('search', '')
     if search:
         items = items.filter(name__icontains=search)
-    return render(request, 'dashboard/partners/list.html', {'partners': items, 'search': search})
+    page = keyset_paginate(request, items, 'order')
+    return render(request, 'dashboard/partners/list.html', {
+        'partners': page.object_list,
+        'page_obj': page,
+        'search': search,
+    })
 
 @admin_required
 def partner_create(request):
@@ -234,14 +240,22 @@ def partner_delete(request, pk):
 
 # ==================== APPLICATIONS ====================
 
-@admin_required
-def application_list(request):
-    items = Application.objects.select_related('user', 'program').all()
-    status_filter = request.GET.get('status', '')
+def _filtered_applications(params):
+    items = Application.objects.all()
+    status_filter = params.get('status', '')
     if status_filter:
         items = items.filter(status=status_filter)
+    return items, status_filter
+
+
+@admin_required
+def application_list(request):
+    items, status_filter = _filtered_applications(request.GET)
+    items = items.select_related('user', 'program')
+    page = keyset_paginate(request, items)
     return render(request, 'dashboard/applications/list.html', {
-        'applications': items,
+        'applications': page.object_list,
+        'page_obj': page,
         'status_filter': status_filter,
     })
 
@@ -256,6 +270,43 @@ def application_status(request, pk):
             messages.success(request, "Ariza holati yangilandi!")
     return redirect('dashboard:application_list')
 
+@admin_required
+def application_bulk(request):
+    """Tanlangan yoki joriy filtrga mos barcha arizalar holatini bittada o'zgartirish."""
+    if request.method != 'POST':
+        return redirect('dashboard:application_list')
+    items, status_filter = _filtered_applications(request.POST)
+    redirect_url = reverse('dashboard:application_list')
+    if status_filter in bulk.STATUSES:
+        redirect_url += f'?status={status_filter}'
+
+    if request.POST.get('scope') != 'filter':
+        ids = [int(pk) for pk in request.POST.getlist('ids') if pk.isdigit()]
+        if not ids:
+            messages.warning(request, "Hech qanday ariza tanlanmagan!")
+            return redirect(redirect_url)
+        items = items.filter(pk__in=ids)
+
+    new_status = request.POST.get('status_action')
+    if new_status not in bulk.STATUSES:
+        messages.error(request, "Noto'g'ri holat!")
+        return redirect(redirect_url)
+
+    issue = new_status == 'approved' and request.POST.get('issue_certificates')
+    if issue:
+        moved, created = bulk.approve(items, issue=True)
+    else:
+        moved = bulk.set_status(items, new_status)
+    labels = dict(Application.STATUS_CHOICES)
+    details = ', '.join(f"{labels[status]}: {count}" for status, count in sorted(moved.items()))
+    message = f"{labels[new_status]} holatiga o'tkazildi: {sum(moved.values())}"
+    if details:
+        message += f" ({details})"
+    if issue:
+        message += f". Sertifikat berildi: {created}"
+    messages.success(request, message)
+    return redirect(redirect_url)
+
 @admin_required
 def application_delete(request, pk):
     return generic_delete(request, Application, pk, 'dashboard:application_list', "Ariza o'chirildi!")
@@ -266,7 +317,11 @@ def application_delete(request, pk):
 @admin_required
 def certificate_list(request):
     items = Certificate.objects.select_related('user', 'program').all()
-    return render(request, 'dashboard/certificates/list.html', {'certificates': items})
+    page = keyset_paginate(request, items, '-issued_date')
+    return render(request, 'dashboard/certificates/list.html', {
+        'certificates': page.object_list,
+        'page_obj': page,
+    })
 
 @admin_required
 def certificate_create(request):
@@ -307,12 +362,19 @@ def user_list(request):
     items = User.objects.all()
     search = request.GET.get('search', '')
     role_filter = request.GET.get('role', '')
-    if search:
-        items = items.filter(username__icontains=search) | items.filter(first_name__icontains=search) | items.filter(last_name__icontains=search)
     if role_filter:
         items = items.filter(role=role_filter)
+    if search and search_index.is_indexed(User):
+        page = search_index.ranked(request, items, search)
+        users = page.object_list
+    else:
+        if search:
+            items = items.filter(username__icontains=search) | items.filter(first_name__icontains=search) | items.filter(last_name__icontains=search)
+        page = keyset_paginate(request, items, '-date_joined')
+        users = page.object_list
     return render(request, 'dashboard/users/list.html', {
-        'users': items,
+        'users': users,
+        'page_obj': page,
         'search': search,
         'role_filter': role_filter,
     })
@@ -356,4 +418,10 @@ def site_settings(request):
             form.save()
             messages.success(request, "Sozlamalar muvaffaqiyatli saqlandi!")
             return redirect('dashboard:site_settings')
-    return render(request, 'dashboard/settings.html', {'form': form})
+    return render(request, 'dashboard/settings.html', {'form': form, 'image_jobs': image_jobs_for(settings_obj)})
+
+
+@admin_required
+def image_job_status(request):
+    # Tahrirlash sahifasi rasm ishlovi tugaguncha shu manzilni so'rab turadi
+    return JsonResponse(job_statuses(request.GET.getlist('name')))
@@ -0,0 +1,20 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import django
+
+# Bu modul modellarni import qilmaydi: spawn bilan ishga tushgan bola jarayon
+# init_worker'ni django.setup() dan oldin shu yerdan import qiladi.
+
+
+def init_worker():
+    django.setup()
+
+
+def worker_pool(workers):
+    """
+    Rasm ishlovi uchun jarayonlar puli. fork o'rniga spawn: fork qilingan bola
+    ota jarayonning ochiq SQLite ulanishini meros qilib olardi — har bir worker
+    o'z ulanishini birinchi so'rovda ochadi.
+    """
+    return ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn'), initializer=init_worker)
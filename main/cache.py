@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.translation import get_language
+
+from dashboard.cache import IMAGES_VERSION, get_version as get_reference_version
+from dashboard.models import Event
+
+LANDING_VERSION_KEY = 'landing:version'
+
+
+def get_version():
+    """Landing modellari har o'zgarganda almashadigan versiya (ETag uchun ham ishlatiladi)."""
+    return cache.get_or_set(LANDING_VERSION_KEY, lambda: timezone.now().timestamp(), None)
+
+
+def _page_key():
+    # Rasm variantlari tayyor bo'lsa sahifa <picture> bilan qayta chiziladi
+    return f'landing:page:{get_language()}:{get_version()}:{get_reference_version(IMAGES_VERSION)}'
+
+
+def _timeout(dates):
+    # Eng yaqin tadbir o'tib ketganda kesh eskiradi
+    timeout = settings.LANDING_CACHE_TIMEOUT
+    if dates:
+        remaining = (min(dates) - timezone.now()).total_seconds()
+        timeout = max(1, min(timeout, int(remaining) + 1))
+    return timeout
+
+
+def get_event_dates():
+    """Landingdagi yaqin tadbirlar sanalari (ETag uchun); iliq keshda so'rovsiz."""
+    key = f'landing:events:{get_version()}'
+    dates = cache.get(key)
+    if dates is None:
+        dates = list(
+            Event.objects.filter(is_active=True, date__gte=timezone.now()).values_list('date', flat=True)[:4]
+        )
+        cache.set(key, dates, _timeout(dates))
+    return dates
+
+
+def get_landing_page():
+    """Keshdagi tayyor landing sahifasi (bytes) yoki None."""
+    return cache.get(_page_key())
+
+
+def set_landing_page(content, events):
+    """Sahifani keshga yozish; eng yaqin tadbir o'tib ketganda kesh eskiradi."""
+    cache.set(_page_key(), content, _timeout([event.date for event in events]))
+
+
+def invalidate_landing_page():
+    """Versiyani almashtirish orqali barcha tillardagi keshni bekor qilish."""
+    cache.set(LANDING_VERSION_KEY, timezone.now().timestamp(), None)
@@ -0,0 +1,17 @@
+from django.db.models.signals import post_save, post_delete
+
+from dashboard.models import (
+    Laboratory, Program, Event, Project, Partner, News, SiteSetting
+)
+from .cache import invalidate_landing_page
+
+LANDING_MODELS = (Laboratory, Program, Event, Project, Partner, News, SiteSetting)
+
+
+def _invalidate_landing(sender, **kwargs):
+    invalidate_landing_page()
+
+
+for model in LANDING_MODELS:
+    post_save.connect(_invalidate_landing, sender=model, dispatch_uid=f'landing_save_{model.__name__}')
+    post_delete.connect(_invalidate_landing, sender=model, dispatch_uid=f'landing_delete_{model.__name__}')
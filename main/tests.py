@@ -1,3 +1,45 @@
-from django.test import TestCase
+from django.conf import settings
+from django.db import connections
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 
-# Create your tests here.
+from dashboard.db import PIN_COOKIE
+from dashboard.models import SiteSetting
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHE,
+    STORAGES={
+        **settings.STORAGES,
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    },
+)
+class LandingPageTests(TestCase):
+    databases = {'default', 'replica'}
+
+    @classmethod
+    def setUpTestData(cls):
+        # Birinchi so'rovda yaratilsa landing versiyasi almashadi
+        SiteSetting.get_settings()
+
+    def test_warm_anonymous_hit_makes_no_queries(self):
+        url = reverse('landing')
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+
+        with CaptureQueriesContext(connections['default']) as primary, \
+                CaptureQueriesContext(connections['replica']) as replica:
+            response = self.client.get(url)
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(len(primary) + len(replica), 0)
+
+    def test_plain_get_does_not_pin_primary(self):
+        # SiteSetting.get_settings() get_or_create orqali yozuvchi bazaga murojaat qiladi, lekin yozmaydi
+        response = self.client.get(reverse('landing'))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(PIN_COOKIE, response.cookies)
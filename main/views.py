@@ -1,17 +1,44 @@
+from django.db.models import Count, Q
+from django.http import HttpResponse
 from django.shortcuts import render
 from django.utils import timezone
-from dashboard.models import (
-    Laboratory, Program, Event, Project, Partner, News, SiteSetting
-)
+from django.views.decorators.http import condition
+from dashboard.assets import add_preloads, preload_links
+from dashboard.cache import get_laboratories, get_partners, get_site_settings
+from dashboard.conditional import make_etag
+from dashboard.models import Laboratory, Program, Event, Project, News
+from .cache import get_event_dates, get_landing_page, get_version, set_landing_page
 
 
+def _landing_etag(request):
+    # Versiya landing modellari o'zgarganda almashadi (main.signals); o'tib ketgan
+    # tadbir ro'yxatdan chiqishi uchun yaqin tadbirlar sanalari ham hisobga olinadi.
+    # Ikkalasi ham keshdan — iliq keshda ETag bazaga murojaat qilmaydi
+    now = timezone.now()
+    upcoming = [date for date in get_event_dates() if date >= now]
+    return make_etag(request, 'landing', get_version(), upcoming, per_user=False)
+
+
+@condition(etag_func=_landing_etag)
 def landing_page(request):
-    settings = SiteSetting.get_settings()
-    laboratories = Laboratory.objects.filter(is_active=True)[:6]
+    # Anonim tashrif buyuruvchilar uchun tayyor sahifa keshdan beriladi
+    anonymous = not request.user.is_authenticated
+    if anonymous:
+        content = get_landing_page()
+        if content is not None:
+            add_preloads(request, preload_links('landing'))
+            response = HttpResponse(content)
+            response.page_cached = True
+            return response
+
+    settings = get_site_settings()
+    laboratories = Laboratory.objects.filter(is_active=True).annotate(
+        program_count=Count('programs', filter=Q(programs__is_active=True)),
+    )[:6]
     programs = Program.objects.filter(is_active=True)[:6]
     events = Event.objects.filter(is_active=True, date__gte=timezone.now())[:4]
-    projects = Project.objects.filter(is_active=True, is_approved=True)[:6]
-    partners = Partner.objects.filter(is_active=True)
+    projects = Project.objects.filter(is_active=True, is_approved=True).select_related('author')[:6]
+    partners = get_partners()
     news = News.objects.filter(is_published=True)[:3]
 
     context = {
@@ -23,9 +50,13 @@ def landing_page(request):
         'partners': partners,
         'news': news,
         'stats': {
-            'labs': Laboratory.objects.filter(is_active=True).count(),
+            'labs': len(get_laboratories()),
             'programs': Program.objects.filter(is_active=True).count(),
             'projects': Project.objects.filter(is_active=True, is_approved=True).count(),
         },
     }
-    return render(request, 'main/landing.html', context)
+    response = render(request, 'main/landing.html', context)
+    if anonymous:
+        set_landing_page(response.content, events)
+        response.page_cached = True
+    return response
@@ -0,0 +1,13 @@
+function toggleSidebar() {
+    document.getElementById('sidebar').classList.toggle('show');
+    document.getElementById('sidebarOverlay').classList.toggle('show');
+}
+
+// Auto-hide alerts after 5 seconds
+document.addEventListener('DOMContentLoaded', function() {
+    setTimeout(function() {
+        document.querySelectorAll('.alert-dismissible').forEach(function(alert) {
+            new bootstrap.Alert(alert).close();
+        });
+    }, 5000);
+});
@@ -0,0 +1,174 @@
+// ============================================
+// PAGE LOADER
+// ============================================
+window.addEventListener('load', () => {
+    const loader = document.getElementById('pageLoader');
+    if (loader) {
+        setTimeout(() => loader.classList.add('hide'), 300);
+        setTimeout(() => loader.remove(), 800);
+    }
+});
+
+// ============================================
+// INIT AOS
+// ============================================
+AOS.init({
+    duration: 700,
+    easing: 'ease-out-cubic',
+    once: true,
+    offset: 60,
+    disable: window.innerWidth < 768 ? 'phone' : false,
+});
+
+// ============================================
+// NAVBAR SCROLL EFFECT
+// ============================================
+const navbar = document.getElementById('mainNav');
+const scrollThreshold = 50;
+
+function handleNavScroll() {
+    if (window.scrollY > scrollThreshold) {
+        navbar.classList.add('scrolled');
+    } else {
+        navbar.classList.remove('scrolled');
+    }
+}
+
+window.addEventListener('scroll', handleNavScroll, { passive: true });
+handleNavScroll();
+
+// ============================================
+// COUNTER ANIMATION
+// ============================================
+const counters = document.querySelectorAll('.counter-animated');
+let countersAnimated = false;
+
+function animateCounters() {
+    if (countersAnimated) return;
+
+    counters.forEach(counter => {
+        const target = parseInt(counter.getAttribute('data-target')) || 0;
+        const duration = 2000;
+        const startTime = performance.now();
+
+        function updateCounter(currentTime) {
+            const elapsed = currentTime - startTime;
+            const progress = Math.min(elapsed / duration, 1);
+
+            // Ease out cubic
+            const eased = 1 - Math.pow(1 - progress, 3);
+            const current = Math.floor(eased * target);
+
+            counter.textContent = current;
+
+            if (progress < 1) {
+                requestAnimationFrame(updateCounter);
+            } else {
+                counter.textContent = target;
+            }
+        }
+
+        requestAnimationFrame(updateCounter);
+    });
+
+    countersAnimated = true;
+}
+
+// Trigger when stats bar is in view
+const statsBar = document.querySelector('.stats-bar');
+if (statsBar) {
+    const statsObserver = new IntersectionObserver((entries) => {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                animateCounters();
+                statsObserver.unobserve(entry.target);
+            }
+        });
+    }, { threshold: 0.3 });
+    statsObserver.observe(statsBar);
+}
+
+// ============================================
+// SCROLL TO TOP
+// ============================================
+const scrollTopBtn = document.getElementById('scrollTop');
+
+window.addEventListener('scroll', () => {
+    if (window.scrollY > 400) {
+        scrollTopBtn.classList.add('show');
+    } else {
+        scrollTopBtn.classList.remove('show');
+    }
+}, { passive: true });
+
+scrollTopBtn.addEventListener('click', () => {
+    window.scrollTo({ top: 0, behavior: 'smooth' });
+});
+
+// ============================================
+// SMOOTH SCROLL FOR NAV LINKS
+// ============================================
+document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+    anchor.addEventListener('click', function (e) {
+        const targetId = this.getAttribute('href');
+        if (targetId === '#') return;
+
+        const target = document.querySelector(targetId);
+        if (target) {
+            e.preventDefault();
+            target.scrollIntoView({ behavior: 'smooth', block: 'start' });
+
+            // Close mobile nav
+            const navCollapse = document.getElementById('navMenu');
+            if (navCollapse && navCollapse.classList.contains('show')) {
+                const bsCollapse = bootstrap.Collapse.getInstance(navCollapse);
+                if (bsCollapse) bsCollapse.hide();
+            }
+        }
+    });
+});
+
+// ============================================
+// ACTIVE NAV STATE ON SCROLL
+// ============================================
+const sections = document.querySelectorAll('section[id]');
+const navLinks = document.querySelectorAll('.nav-link-custom');
+
+function updateActiveNav() {
+    const scrollPos = window.scrollY + 120;
+
+    sections.forEach(section => {
+        const sectionTop = section.offsetTop;
+        const sectionHeight = section.offsetHeight;
+        const sectionId = section.getAttribute('id');
+
+        if (scrollPos >= sectionTop && scrollPos < sectionTop + sectionHeight) {
+            navLinks.forEach(link => {
+                link.classList.remove('active');
+                if (link.getAttribute('href') === `#${sectionId}`) {
+                    link.classList.add('active');
+                }
+            });
+        }
+    });
+}
+
+window.addEventListener('scroll', updateActiveNav, { passive: true });
+
+// ============================================
+// PARALLAX-LIKE SUBTLE EFFECT ON HERO
+// ============================================
+const heroSection = document.querySelector('.hero-section');
+const floatingShapes = document.querySelectorAll('.floating-shapes .shape');
+
+if (heroSection && window.innerWidth > 991) {
+    window.addEventListener('mousemove', (e) => {
+        const x = (e.clientX / window.innerWidth - 0.5) * 20;
+        const y = (e.clientY / window.innerHeight - 0.5) * 20;
+
+        floatingShapes.forEach((shape, i) => {
+            const factor = (i + 1) * 0.5;
+            shape.style.transform = `translate(${x * factor}px, ${y * factor}px)`;
+        });
+    });
+}
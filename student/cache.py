@@ -0,0 +1,134 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, Count, IntegerField, Sum, Value, When, Window
+from django.utils import timezone
+
+from dashboard.models import Application, Certificate, Event, News, Program, Project
+
+FEED_VERSION_KEY = 'student:feed:version'
+# Arizalar dastur obyektlari bilan keshlanadi — dastur o'zgarsa barcha talabalar
+# qismi shu versiya orqali birdaniga eskiradi
+HOME_VERSION_KEY = 'student:home:version'
+
+
+def _window_count(**conditions):
+    # Ro'yxat bilan bir so'rovda: COUNT/SUM(...) OVER () LIMIT dan oldin hisoblanadi
+    if not conditions:
+        return Window(Count('pk'))
+    return Window(Sum(Case(When(then=Value(1), **conditions), default=Value(0), output_field=IntegerField())))
+
+
+def _first_rows(queryset, limit, **totals):
+    """Birinchi `limit` ta yozuv va ular bilan birga kelgan umumiy sonlar."""
+    rows = list(queryset.annotate(**totals)[:limit])
+    counts = {name: getattr(rows[0], name) if rows else 0 for name in totals}
+    return rows, counts
+
+
+# ==================== PER-USER ====================
+
+def _user_key(user_id, version=None):
+    if version is None:
+        version = cache.get_or_set(HOME_VERSION_KEY, lambda: timezone.now().timestamp(), None)
+    return f'student:home:user:{version}:{user_id}'
+
+
+def _load_user_home(user):
+    applications, application_counts = _first_rows(
+        Application.objects.filter(user=user).select_related('program'), 5,
+        total_applications=_window_count(),
+        approved_applications=_window_count(status='approved'),
+    )
+    certificates, certificate_counts = _first_rows(
+        Certificate.objects.filter(user=user), 5,
+        total_certificates=_window_count(),
+    )
+    # Jami son barcha loyihalar bo'yicha, ro'yxat esa faqat faollardan: faollari
+    # oldinga tartiblanadi va nofaollari Python'da tashlab yuboriladi
+    projects, project_counts = _first_rows(
+        Project.objects.filter(author=user).order_by('-is_active', '-created_at'), 3,
+        total_projects=_window_count(),
+    )
+    return {
+        'my_applications': applications,
+        'my_certificates': certificates,
+        'my_projects': [project for project in projects if project.is_active],
+        **application_counts,
+        **certificate_counts,
+        **project_counts,
+    }
+
+
+def get_user_home(user):
+    """Talaba bosh sahifasining shaxsiy qismi: so'nggi arizalar, sertifikatlar, loyihalar va sonlar."""
+    key = _user_key(user.pk)
+    data = cache.get(key)
+    if data is None:
+        data = _load_user_home(user)
+        cache.set(key, data, settings.STUDENT_HOME_CACHE_TIMEOUT)
+    return data
+
+
+def invalidate_user_home(*user_ids):
+    version = cache.get(HOME_VERSION_KEY)
+    if version is not None:
+        cache.delete_many([_user_key(user_id, version) for user_id in user_ids if user_id is not None])
+
+
+def invalidate_user_homes():
+    """Barcha talabalarning shaxsiy qismini eskirtirish (dastur o'zgarganda)."""
+    cache.set(HOME_VERSION_KEY, timezone.now().timestamp(), None)
+
+
+def _applied_key(user_id):
+    return f'student:applied:{user_id}'
+
+
+def get_applied_program_ids(user_id):
+    """Talaba ariza topshirgan dasturlar ID to'plami."""
+    key = _applied_key(user_id)
+    program_ids = cache.get(key)
+    if program_ids is None:
+        program_ids = frozenset(Application.objects.filter(user_id=user_id).values_list('program_id', flat=True))
+        cache.set(key, program_ids, settings.STUDENT_HOME_CACHE_TIMEOUT)
+    return program_ids
+
+
+def mark_applied(user_id, program_id):
+    """Navbatga qo'yilgan arizani bazaga yozilguncha ham 'topshirilgan' deb ko'rsatish."""
+    program_ids = get_applied_program_ids(user_id) | {program_id}
+    cache.set(_applied_key(user_id), program_ids, settings.STUDENT_HOME_CACHE_TIMEOUT)
+
+
+def invalidate_applied_programs(*user_ids):
+    cache.delete_many([_applied_key(user_id) for user_id in user_ids if user_id is not None])
+
+
+# ==================== SHARED FEED ====================
+
+def _feed_key():
+    version = cache.get_or_set(FEED_VERSION_KEY, lambda: timezone.now().timestamp(), None)
+    return f'student:home:feed:{version}'
+
+
+def get_home_feed():
+    """Barcha talabalar uchun bir xil qism: yaqin tadbirlar, faol dasturlar, yangiliklar."""
+    key = _feed_key()
+    feed = cache.get(key)
+    if feed is None:
+        feed = {
+            'upcoming_events': list(Event.objects.filter(date__gte=timezone.now(), is_active=True)[:4]),
+            'active_programs': list(Program.objects.filter(is_active=True)[:4]),
+            'latest_news': list(News.objects.filter(is_published=True)[:3]),
+        }
+        # Eng yaqin tadbir o'tib ketganda ro'yxat eskiradi
+        timeout = settings.STUDENT_HOME_CACHE_TIMEOUT
+        if feed['upcoming_events']:
+            remaining = (min(event.date for event in feed['upcoming_events']) - timezone.now()).total_seconds()
+            timeout = max(1, min(timeout, int(remaining) + 1))
+        cache.set(key, feed, timeout)
+    return feed
+
+
+def invalidate_home_feed():
+    cache.set(FEED_VERSION_KEY, timezone.now().timestamp(), None)
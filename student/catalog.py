@@ -0,0 +1,120 @@
+import hashlib
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import BooleanField, Count, ExpressionWrapper, Q, Value
+from django.utils import timezone
+
+from dashboard.models import Program
+
+CATALOG_VERSION_KEY = 'student:catalog:version'
+FACETS = ('level', 'format', 'laboratory_id', 'eligible')
+
+
+def user_age(user):
+    """To'liq yillar soni; tug'ilgan sana kiritilmagan bo'lsa None."""
+    birth_date = getattr(user, 'birth_date', None)
+    if birth_date is None:
+        return None
+    today = timezone.localdate()
+    return today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
+
+
+def parse_filters(params):
+    """GET parametrlaridan {facet: qiymat}; noto'g'ri qiymatlar e'tiborsiz qoldiriladi."""
+    filters = {}
+    level = params.get('level', '')
+    if level in dict(Program.LEVEL_CHOICES):
+        filters['level'] = level
+    format_ = params.get('format', '')
+    if format_ in dict(Program.FORMAT_CHOICES):
+        filters['format'] = format_
+    lab = params.get('lab', '')
+    if lab.isdigit():
+        filters['laboratory_id'] = int(lab)
+    if params.get('eligible'):
+        filters['eligible'] = True
+    return filters
+
+
+def _base_queryset(search):
+    programs = Program.objects.filter(is_active=True)
+    if search:
+        programs = programs.filter(name__icontains=search)
+    return programs
+
+
+def _eligible_expression(age):
+    if age is None:
+        return Value(False, output_field=BooleanField())
+    return ExpressionWrapper(Q(age_min__lte=age, age_max__gte=age), output_field=BooleanField())
+
+
+def filter_programs(search, filters, age):
+    programs = _base_queryset(search)
+    for facet, value in filters.items():
+        if facet == 'eligible':
+            if age is None:
+                return programs.none()
+            programs = programs.filter(age_min__lte=age, age_max__gte=age)
+        else:
+            programs = programs.filter(**{facet: value})
+    return programs
+
+
+def _matches(group, filters, skip):
+    return all(group[facet] == value for facet, value in filters.items() if facet != skip)
+
+
+def _compute_facets(search, filters, age):
+    # Bitta GROUP BY so'rovi: (daraja, format, laboratoriya, yoshga mos) bo'yicha sonlar.
+    # Har bir facet soni qolgan filtrlar qo'llangan holda hisoblanadi — tanlangan
+    # darajadan boshqasiga o'tsa nechta dastur chiqishi ko'rinib turadi.
+    groups = list(
+        _base_queryset(search)
+        .order_by()
+        .values('level', 'format', 'laboratory_id', eligible=_eligible_expression(age))
+        .annotate(count=Count('pk'))
+    )
+    facets = {facet: Counter() for facet in FACETS}
+    total = 0
+    for group in groups:
+        group['eligible'] = bool(group['eligible'])
+        for facet in FACETS:
+            if _matches(group, filters, skip=facet):
+                facets[facet][group[facet]] += group['count']
+        if _matches(group, filters, skip=None):
+            total += group['count']
+    return {
+        'total': total,
+        'level': dict(facets['level']),
+        'format': dict(facets['format']),
+        'laboratory': dict(facets['laboratory_id']),
+        'eligible': facets['eligible'][True] if age is not None else None,
+    }
+
+
+def get_facets(search, filters, age):
+    """Filtrlar kombinatsiyasi bo'yicha keshlangan facet sonlari (qidiruvsiz holat uchun)."""
+    if search:
+        # Erkin matn kesh kalitlarini cheksiz ko'paytiradi — qidiruv natijasi keshlanmaydi
+        return _compute_facets(search, filters, age)
+    version = cache.get_or_set(CATALOG_VERSION_KEY, lambda: timezone.now().timestamp(), None)
+    combination = repr((age, sorted(filters.items())))
+    digest = hashlib.md5(combination.encode(), usedforsecurity=False).hexdigest()
+    key = f'student:catalog:facets:{version}:{digest}'
+    facets = cache.get(key)
+    if facets is None:
+        facets = _compute_facets(search, filters, age)
+        cache.set(key, facets, settings.CATALOG_CACHE_TIMEOUT)
+    return facets
+
+
+def choice_counts(counts, choices):
+    """Shablon uchun [(qiymat, nomi, soni)]."""
+    return [(value, label, counts.get(value, 0)) for value, label in choices]
+
+
+def invalidate_catalog():
+    cache.set(CATALOG_VERSION_KEY, timezone.now().timestamp(), None)
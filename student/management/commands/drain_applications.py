@@ -0,0 +1,34 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from student.submissions import compact, drain_lock, journal_position, read_batch, store_batch
+
+
+class Command(BaseCommand):
+    help = "Navbat jurnalidagi arizalarni paketlab bazaga yozuvchi yagona yozuvchi"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch', type=int, default=settings.APPLICATION_QUEUE_BATCH, help="Bitta tranzaksiyadagi arizalar soni")
+        parser.add_argument('--once', action='store_true', help="Jurnal bo'shagach to'xtash")
+
+    def handle(self, *args, **options):
+        try:
+            with drain_lock():
+                self.drain(options['batch'], options['once'])
+        except BlockingIOError:
+            raise CommandError("Boshqa drain_applications jarayoni ishlab turibdi")
+
+    def drain(self, batch, once):
+        while True:
+            generation, offset = journal_position()
+            records, next_offset = read_batch(offset, batch)
+            if next_offset != offset:
+                stored = store_batch(records, generation, next_offset)
+                self.stdout.write(f"  Bazaga yozildi: {stored} / {len(records)}")
+                continue
+            compact(offset)
+            if once:
+                break
+            time.sleep(settings.APPLICATION_QUEUE_POLL_SECONDS)
@@ -0,0 +1,27 @@
+# Generated by Django 6.0.2 on 2026-10-18 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationQueueState',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('generation', models.CharField(blank=True, max_length=32, verbose_name='Jurnal avlodi')),
+                ('offset', models.PositiveBigIntegerField(default=0, verbose_name="O'tkazilgan baytlar")),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Arizalar navbati holati',
+                'verbose_name_plural': 'Arizalar navbati holati',
+            },
+        ),
+    ]
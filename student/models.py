@@ -1,3 +1,24 @@
 from django.db import models
 
-# Create your models here.
+
+class ApplicationQueueState(models.Model):
+    """drain_applications holati: jurnalning qaysi avlodi qayergacha bazaga o'tkazilgan."""
+    generation = models.CharField(max_length=32, blank=True, verbose_name="Jurnal avlodi")
+    offset = models.PositiveBigIntegerField(default=0, verbose_name="O'tkazilgan baytlar")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Arizalar navbati holati"
+        verbose_name_plural = "Arizalar navbati holati"
+
+    def __str__(self):
+        return f'{self.generation}:{self.offset}'
+
+    def save(self, *args, **kwargs):
+        self.pk = 1
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def get_state(cls):
+        obj, created = cls.objects.get_or_create(pk=1)
+        return obj
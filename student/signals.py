@@ -0,0 +1,63 @@
+from django.db import transaction
+from django.db.models.signals import post_init, post_save, post_delete
+
+from dashboard.models import Application, Certificate, Event, News, Program, Project
+from dashboard.signals import applications_changed
+from .cache import invalidate_applied_programs, invalidate_home_feed, invalidate_user_home, invalidate_user_homes
+from .catalog import invalidate_catalog
+
+# Model -> talabani ko'rsatuvchi maydon
+OWNER_FIELDS = {
+    Application: 'user_id',
+    Certificate: 'user_id',
+    Project: 'author_id',
+}
+FEED_MODELS = (Event, News, Program)
+
+
+def _remember_owner(sender, instance, **kwargs):
+    # Admin yozuvni boshqa talabaga o'tkazsa, eski egasining keshi ham tozalanadi
+    instance._loaded_owner_id = instance.__dict__.get(OWNER_FIELDS[sender])
+
+
+def _invalidate_owner(sender, instance, **kwargs):
+    user_ids = {instance._loaded_owner_id, getattr(instance, OWNER_FIELDS[sender])}
+    instance._loaded_owner_id = getattr(instance, OWNER_FIELDS[sender])
+    transaction.on_commit(lambda: invalidate_user_home(*user_ids))
+    if sender is Application:
+        transaction.on_commit(lambda: invalidate_applied_programs(*user_ids))
+
+
+for model in OWNER_FIELDS:
+    post_init.connect(_remember_owner, sender=model, dispatch_uid=f'student_home_init_{model.__name__}')
+    post_save.connect(_invalidate_owner, sender=model, dispatch_uid=f'student_home_save_{model.__name__}')
+    post_delete.connect(_invalidate_owner, sender=model, dispatch_uid=f'student_home_delete_{model.__name__}')
+
+
+def _invalidate_users(sender, user_ids, **kwargs):
+    # Admin paneldagi ommaviy amallar (dashboard.bulk)
+    user_ids = set(user_ids)
+    transaction.on_commit(lambda: invalidate_user_home(*user_ids))
+    transaction.on_commit(lambda: invalidate_applied_programs(*user_ids))
+
+
+applications_changed.connect(_invalidate_users, dispatch_uid='student_home_bulk')
+
+
+def _invalidate_feed(sender, **kwargs):
+    transaction.on_commit(invalidate_home_feed)
+
+
+for model in FEED_MODELS:
+    post_save.connect(_invalidate_feed, sender=model, dispatch_uid=f'student_feed_save_{model.__name__}')
+    post_delete.connect(_invalidate_feed, sender=model, dispatch_uid=f'student_feed_delete_{model.__name__}')
+
+
+def _invalidate_catalog(sender, **kwargs):
+    transaction.on_commit(invalidate_catalog)
+    # Talabalar arizalari ro'yxatidagi dastur nomi/holati ham yangilanishi kerak
+    transaction.on_commit(invalidate_user_homes)
+
+
+post_save.connect(_invalidate_catalog, sender=Program, dispatch_uid='student_catalog_save')
+post_delete.connect(_invalidate_catalog, sender=Program, dispatch_uid='student_catalog_delete')
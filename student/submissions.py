@@ -0,0 +1,175 @@
+import fcntl
+import json
+import os
+import uuid
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.models import User
+from dashboard.cache import invalidate_pending_count
+from dashboard.models import Application, Program
+from dashboard.stats import invalidate_stats
+from .cache import invalidate_applied_programs, invalidate_user_home
+from .models import ApplicationQueueState
+
+# Ro'yxatga olish ochilgan daqiqalarda har bir ariza SQLite'ning yagona yozuvchi
+# qulfi uchun navbat kutmasligi uchun arizalar avval mahalliy jurnalga qo'shiladi
+# (bitta write + fsync), bazaga esa drain_applications buyrug'i paketlab yozadi.
+#
+# Jurnal faqat oxiriga yoziladi va birinchi qatorida tasodifiy avlod (generation)
+# turadi. Qayerdagacha o'tkazilgani (avlod, offset) ApplicationQueueState'da
+# arizalar bilan bitta tranzaksiyada saqlanadi: jarayon qayerda to'xtamasin,
+# bazaga tushgan yozuv qayta o'qilmaydi — talaba shu orada bekor qilgan ariza
+# qayta tiklanmaydi. Jurnal bo'shatilgach keyingi yozuvchi yangi avlod boshlaydi,
+# eski avlodning offseti esa e'tiborsiz qoladi.
+
+JOURNAL_NAME = 'applications.journal'
+LOCK_NAME = 'drain.lock'
+
+
+def _path(name):
+    return os.path.join(settings.APPLICATION_QUEUE_DIR, name)
+
+
+def _fsync_directory():
+    fd = os.open(settings.APPLICATION_QUEUE_DIR, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def enqueue_application(user_id, program_id, message):
+    """Arizani jurnalga qo'shish; funksiya qaytganda yozuv diskda turibdi."""
+    record = {
+        'user': user_id,
+        'program': program_id,
+        'message': message,
+        'queued_at': timezone.now().isoformat(),
+    }
+    line = (json.dumps(record, ensure_ascii=False) + '\n').encode()
+    os.makedirs(settings.APPLICATION_QUEUE_DIR, exist_ok=True)
+    created = not os.path.exists(_path(JOURNAL_NAME))
+    fd = os.open(_path(JOURNAL_NAME), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+    try:
+        # Bir nechta gunicorn worker bir vaqtda yozsa ham qatorlar aralashmaydi
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        if os.fstat(fd).st_size == 0:
+            # Yangi (yoki bo'shatilgan) jurnal — yangi avlod sarlavhasi bilan boshlanadi
+            line = (json.dumps({'generation': uuid.uuid4().hex}) + '\n').encode() + line
+        os.write(fd, line)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    if created:
+        _fsync_directory()
+
+
+def journal_position():
+    """
+    (avlod, offset): jurnalning qayeridan o'qishni davom ettirish kerak.
+    Bazadagi holat boshqa avlodga tegishli bo'lsa — sarlavhadan keyingi joydan.
+    """
+    try:
+        with open(_path(JOURNAL_NAME), 'rb') as fh:
+            header = fh.readline()
+    except FileNotFoundError:
+        return None, 0
+    # Sarlavha hali to'liq yozilmagan
+    if not header.endswith(b'\n'):
+        return None, 0
+    generation = json.loads(header).get('generation')
+    start = len(header)
+    if generation is None:
+        # Sarlavhasiz (avvalgi formatdagi) jurnal — birinchi qatori ham ariza
+        generation, start = '', 0
+    state = ApplicationQueueState.get_state()
+    if state.generation == generation:
+        return generation, state.offset
+    return generation, start
+
+
+@contextmanager
+def drain_lock():
+    """Jurnalni faqat bitta jarayon bazaga o'tkazadi; band bo'lsa BlockingIOError."""
+    os.makedirs(settings.APPLICATION_QUEUE_DIR, exist_ok=True)
+    with open(_path(LOCK_NAME), 'w') as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        yield
+
+
+def read_batch(offset, limit):
+    """offset dan boshlab ko'pi bilan limit ta to'liq qator: (yozuvlar, yangi offset)."""
+    try:
+        fh = open(_path(JOURNAL_NAME), 'rb')
+    except FileNotFoundError:
+        return [], offset
+    records = []
+    with fh:
+        fh.seek(offset)
+        while len(records) < limit:
+            line = fh.readline()
+            # Oxirgi qator hali yozilayotgan bo'lishi mumkin — keyingi safar o'qiladi
+            if not line.endswith(b'\n'):
+                break
+            offset += len(line)
+            if line.strip():
+                records.append(json.loads(line))
+    return records, offset
+
+
+def store_batch(records, generation, offset):
+    """
+    Yozuvlarni va jurnaldagi yangi o'rinni bitta tranzaksiyada bazaga yozish;
+    bazaga o'tgan arizalar sonini qaytaradi.
+    """
+    user_ids = {record['user'] for record in records}
+    program_ids = {record['program'] for record in records}
+    with transaction.atomic():
+        # Navbatda turgan paytda o'chirilgan talaba yoki dastur butun paketni buzmasligi kerak.
+        # Tekshiruv INSERT bilan bitta tranzaksiyada (IMMEDIATE — yozuv qulfi boshidanoq
+        # olingan): oradagi o'chirish FK xatosi bilan paketni va offsetni to'xtatib qo'ymaydi
+        existing_users = set(User.objects.filter(pk__in=user_ids).values_list('pk', flat=True))
+        existing_programs = set(Program.objects.filter(pk__in=program_ids).values_list('pk', flat=True))
+        applications = [
+            Application(
+                user_id=record['user'],
+                program_id=record['program'],
+                message=record['message'],
+            )
+            for record in records
+            if record['user'] in existing_users and record['program'] in existing_programs
+        ]
+        before = Application.objects.filter(user_id__in=existing_users).count()
+        # Jurnal tartibi saqlanadi: avval topshirgan talabaning arizasi kichikroq id oladi
+        Application.objects.bulk_create(applications, ignore_conflicts=True)
+        stored = Application.objects.filter(user_id__in=existing_users).count() - before
+        ApplicationQueueState(generation=generation, offset=offset).save()
+        # bulk_create signallarni chaqirmaydi — keshlar shu yerda tozalanadi
+        transaction.on_commit(invalidate_pending_count)
+        transaction.on_commit(invalidate_stats)
+        transaction.on_commit(lambda: invalidate_user_home(*user_ids))
+        transaction.on_commit(lambda: invalidate_applied_programs(*user_ids))
+    return stored
+
+
+def compact(offset):
+    """Jurnal to'liq o'tkazilgan bo'lsa uni bo'shatish (yozuvchilar qulfi ostida)."""
+    try:
+        fd = os.open(_path(JOURNAL_NAME), os.O_WRONLY)
+    except FileNotFoundError:
+        return False
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        size = os.fstat(fd).st_size
+        if size == 0 or size != offset:
+            return False
+        # Keyingi yozuvchi yangi avlod boshlaydi — bazadagi eski offset endi ishlatilmaydi
+        os.ftruncate(fd, 0)
+        os.fsync(fd)
+        return True
+    finally:
+        os.close(fd)
@@ -1,3 +1,220 @@
-from django.test import TestCase
+import os
+import shutil
+import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+from django.db import connections
+from django.test import Client, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+
+from accounts.models import User
+from dashboard.db import PIN_COOKIE
+from dashboard.models import Application, Certificate, Program
+from .cache import get_user_home
+from .catalog import get_facets
+from .submissions import JOURNAL_NAME, enqueue_application, journal_position, read_batch, store_batch
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class UserHomeCacheTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user('talaba', password='parol12345')
+        self.program = Program.objects.create(name='Robototexnika')
+        Application.objects.create(user=self.user, program=self.program)
+
+    def test_program_change_refreshes_cached_applications(self):
+        self.assertEqual(get_user_home(self.user)['my_applications'][0].program.name, 'Robototexnika')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.program.name = 'Sun\'iy intellekt'
+            self.program.save()
+
+        self.assertEqual(get_user_home(self.user)['my_applications'][0].program.name, 'Sun\'iy intellekt')
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class CatalogFacetTests(TestCase):
+
+    def test_search_facets_are_not_cached(self):
+        Program.objects.create(name='Robototexnika')
+        self.assertEqual(get_facets('robot', {}, None)['total'], 1)
+        self.assertEqual(get_facets('', {}, None)['total'], 1)
+
+        # on_commit bajarilmaydi — katalog versiyasi o'zgarmaydi
+        Program.objects.create(name='Robot sport')
+        self.assertEqual(get_facets('robot', {}, None)['total'], 2)
+        self.assertEqual(get_facets('', {}, None)['total'], 1)
+
+
+@override_settings(CACHES=LOCMEM_CACHE, APPLICATION_QUEUE=False)
+class ConcurrentApplyTests(TransactionTestCase):
+    databases = {'default', 'replica'}
+    SUBMITS = 200
+    WORKERS = 16
+
+    def test_parallel_submits_create_one_application(self):
+        user = User.objects.create_user('talaba', password='parol12345')
+        program = Program.objects.create(name='Robototexnika')
+        url = reverse('student:program_apply', args=[program.pk])
+        login = Client()
+        login.force_login(user)
+        success_url = reverse('student:my_applications')
+        duplicate_url = reverse('student:program_detail', args=[program.pk])
+
+        def submit(_):
+            client = Client(raise_request_exception=False)
+            client.cookies[settings.SESSION_COOKIE_NAME] = login.cookies[settings.SESSION_COOKIE_NAME].value
+            try:
+                response = client.post(url, {'message': 'Salom'})
+                return response.status_code, response.get('Location')
+            finally:
+                connections.close_all()
+
+        # Oldindan tekshiruv (keshdagi ariza to'plami) o'chirilgan: har bir so'rov
+        # INSERT gacha yetib boradi va takrorni faqat unique cheklov ushlaydi
+        with mock.patch('student.views.get_applied_program_ids', return_value=frozenset()), \
+                ThreadPoolExecutor(max_workers=self.WORKERS) as pool:
+            results = Counter(pool.map(submit, range(self.SUBMITS)))
+
+        self.assertEqual(results, {(302, success_url): 1, (302, duplicate_url): self.SUBMITS - 1})
+        self.assertEqual(Application.objects.filter(user=user, program=program).count(), 1)
+
+
+class ApplicationQueueTests(TestCase):
+
+    def setUp(self):
+        queue_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, queue_dir, ignore_errors=True)
+        override = override_settings(APPLICATION_QUEUE_DIR=queue_dir, CACHES=LOCMEM_CACHE)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.journal = os.path.join(queue_dir, JOURNAL_NAME)
+        self.user = User.objects.create_user('talaba', password='parol12345')
+        self.programs = [Program.objects.create(name=f'Dastur {index}') for index in range(3)]
+
+    def drain(self):
+        call_command('drain_applications', once=True, stdout=StringIO())
+
+    def applied(self):
+        return set(Application.objects.filter(user=self.user).values_list('program_id', flat=True))
+
+    def test_drain_then_restart_is_idempotent(self):
+        for program in self.programs[:2]:
+            enqueue_application(self.user.pk, program.pk, 'Salom')
+        self.drain()
+        self.drain()
+
+        self.assertEqual(self.applied(), {self.programs[0].pk, self.programs[1].pk})
+        # To'liq o'tkazilgan jurnal bo'shatiladi
+        self.assertEqual(os.path.getsize(self.journal), 0)
+
+    def test_replay_after_crash_keeps_cancelled_application_deleted(self):
+        enqueue_application(self.user.pk, self.programs[0].pk, 'Salom')
+        # Paket bazaga yozildi, jurnal bo'shatilmasdan jarayon to'xtadi
+        generation, offset = journal_position()
+        records, next_offset = read_batch(offset, 10)
+        store_batch(records, generation, next_offset)
+        # Talaba shu orada arizani bekor qildi
+        Application.objects.filter(user=self.user).delete()
+
+        self.drain()
+
+        self.assertEqual(self.applied(), set())
+
+    def test_new_generation_after_compaction(self):
+        enqueue_application(self.user.pk, self.programs[0].pk, 'Salom')
+        self.drain()
+        Application.objects.filter(user=self.user).delete()
+
+        # Bo'shatilgan jurnalga yozilgan yangi ariza eski offsetdan qat'i nazar o'qiladi
+        enqueue_application(self.user.pk, self.programs[2].pk, 'Salom')
+        self.drain()
+
+        self.assertEqual(self.applied(), {self.programs[2].pk})
+
+    def test_deleted_program_is_skipped_and_drain_moves_on(self):
+        enqueue_application(self.user.pk, self.programs[0].pk, 'Salom')
+        enqueue_application(self.user.pk, self.programs[1].pk, 'Salom')
+        self.programs[0].delete()
+
+        self.drain()
+
+        self.assertEqual(self.applied(), {self.programs[1].pk})
+        self.assertEqual(os.path.getsize(self.journal), 0)
+
+
+class CertificateDownloadTests(TestCase):
+    CONTENT = b'%PDF-1.4 ' + bytes(range(256)) * 4
+
+    def setUp(self):
+        storage_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, storage_dir, ignore_errors=True)
+        self.storage = FileSystemStorage(location=storage_dir)
+        patcher = mock.patch.object(Certificate._meta.get_field('pdf_file'), 'storage', self.storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.owner = User.objects.create_user('egasi', password='parol12345')
+        self.certificate = Certificate.objects.create(
+            user=self.owner, title='Robototexnika', certificate_id='SRT-1', issued_date='2026-01-01',
+            pdf_file=self.storage.save('certificates/srt.pdf', ContentFile(self.CONTENT)),
+        )
+        self.url = reverse('student:certificate_download', args=[self.certificate.pk])
+
+    def download(self, user, **headers):
+        self.client.force_login(user)
+        # TestCase tranzaksiyasi replika ulanishiga ko'rinmaydi — kirishdan keyingidek asosiy baza
+        self.client.cookies[PIN_COOKIE] = '1'
+        return self.client.get(self.url, headers=headers)
+
+    def test_owner_and_admin_get_the_file(self):
+        admin = User.objects.create_user('admin', password='parol12345', role='admin')
+        for user in (self.owner, admin):
+            response = self.download(user)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(b''.join(response.streaming_content), self.CONTENT)
+            self.assertEqual(response['Content-Disposition'], 'inline; filename="SRT-1.pdf"')
+            self.assertEqual(response['Accept-Ranges'], 'bytes')
+
+    def test_other_student_gets_404(self):
+        other = User.objects.create_user('boshqa', password='parol12345')
+        self.assertEqual(self.download(other).status_code, 404)
+
+    def test_missing_file_is_404(self):
+        self.storage.delete(self.certificate.pdf_file.name)
+        self.assertEqual(self.download(self.owner).status_code, 404)
+
+    def test_range_requests(self):
+        response = self.download(self.owner, Range='bytes=4-13')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b''.join(response.streaming_content), self.CONTENT[4:14])
+        self.assertEqual(response['Content-Range'], f'bytes 4-13/{len(self.CONTENT)}')
+
+        response = self.download(self.owner, Range='bytes=-5')
+        self.assertEqual(b''.join(response.streaming_content), self.CONTENT[-5:])
+
+        response = self.download(self.owner, Range=f'bytes={len(self.CONTENT)}-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(self.CONTENT)}')
+
+    def test_web_server_headers(self):
+        name = self.certificate.pdf_file.name
+        with override_settings(PROTECTED_MEDIA_SERVER='nginx'):
+            response = self.download(self.owner)
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected/{name}')
+        self.assertEqual(response.content, b'')
+
+        with override_settings(PROTECTED_MEDIA_SERVER='sendfile'):
+            response = self.download(self.owner)
+        self.assertEqual(response['X-Sendfile'], self.storage.path(name))
+        self.assertEqual(response['Content-Disposition'], 'inline; filename="SRT-1.pdf"')
@@ -33,6 +33,7 @@ urlpatterns = [
 
     # Certificates
     path('certificates/', views.my_certificates, name='my_certificates'),
+    path('certificates/<int:pk>/download/', views.certificate_download, name='certificate_download'),
 
     # News
     path('news/', views.news_list, name='news_list'),
@@ -1,19 +1,33 @@
+import os
+
+from django.conf import settings
+from django.http import Http404
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.utils import timezone
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max
+from django.views.decorators.http import condition
 from functools import wraps
 
 from accounts.models import User
+from dashboard.cache import get_laboratories
+from dashboard.conditional import make_etag
+from dashboard.downloads import protected_file_response
+from dashboard.images import get_manifest
 from dashboard.models import (
-    Laboratory, Program, Event, Project,
+    Program, Event, Project,
     Application, Certificate, News, SiteSetting
 )
+from dashboard.pagination import keyset_paginate
+from .cache import get_applied_program_ids, get_home_feed, get_user_home, mark_applied
+from .catalog import choice_counts, filter_programs, get_facets, parse_filters, user_age
 from .forms import (
     StudentLoginForm, StudentRegisterForm, StudentProfileForm,
     ApplicationForm, StudentProjectForm
 )
+from .submissions import enqueue_application
 
 
 def student_required(view_func):
@@ -71,25 +85,8 @@ def student_logout(request):
 
 @student_required
 def student_home(request):
-    my_applications = Application.objects.filter(user=request.user).select_related('program')[:5]
-    my_certificates = Certificate.objects.filter(user=request.user)[:5]
-    upcoming_events = Event.objects.filter(date__gte=timezone.now(), is_active=True)[:4]
-    active_programs = Program.objects.filter(is_active=True)[:4]
-    latest_news = News.objects.filter(is_published=True)[:3]
-    my_projects = Project.objects.filter(author=request.user, is_active=True)[:3]
-
-    context = {
-        'my_applications': my_applications,
-        'my_certificates': my_certificates,
-        'upcoming_events': upcoming_events,
-        'active_programs': active_programs,
-        'latest_news': latest_news,
-        'my_projects': my_projects,
-        'total_applications': Application.objects.filter(user=request.user).count(),
-        'approved_applications': Application.objects.filter(user=request.user, status='approved').count(),
-        'total_certificates': Certificate.objects.filter(user=request.user).count(),
-        'total_projects': Project.objects.filter(author=request.user).count(),
-    }
+    # Shaxsiy qism foydalanuvchi bo'yicha, lenta esa barcha talabalar uchun umumiy keshlanadi
+    context = {**get_user_home(request.user), **get_home_feed()}
     return render(request, 'student/home.html', context)
 
 
@@ -111,47 +108,61 @@ def student_profile(request):
 
 @student_required
 def program_list(request):
-    programs = Program.objects.filter(is_active=True)
-    level_filter = request.GET.get('level', '')
-    format_filter = request.GET.get('format', '')
-    search = request.GET.get('search', '')
-    lab_filter = request.GET.get('lab', '')
-
-    if level_filter:
-        programs = programs.filter(level=level_filter)
-    if format_filter:
-        programs = programs.filter(format=format_filter)
-    if search:
-        programs = programs.filter(name__icontains=search)
-    if lab_filter:
-        programs = programs.filter(laboratory_id=lab_filter)
-
-    labs = Laboratory.objects.filter(is_active=True)
+    # Shablondagi qidiruv maydoni "q" deb nomlangan; eski "search" havolalari ham ishlaydi
+    search = request.GET.get('q', request.GET.get('search', '')).strip()
+    filters = parse_filters(request.GET)
+    age = user_age(request.user)
+
+    programs = filter_programs(search, filters, age)
+    page = keyset_paginate(request, programs)
+    facets = get_facets(search, filters, age)
+    labs = get_laboratories()
     context = {
-        'programs': programs,
+        'programs': page.object_list,
+        'page_obj': page,
+        'facets': facets,
+        'level_choices': choice_counts(facets['level'], Program.LEVEL_CHOICES),
+        'format_choices': choice_counts(facets['format'], Program.FORMAT_CHOICES),
+        'lab_choices': choice_counts(facets['laboratory'], [(lab.pk, lab.name) for lab in labs]),
+        'age': age,
         'labs': labs,
-        'level_filter': level_filter,
-        'format_filter': format_filter,
+        'level_filter': filters.get('level', ''),
+        'format_filter': filters.get('format', ''),
         'search': search,
-        'lab_filter': lab_filter,
+        'lab_filter': filters.get('laboratory_id', ''),
+        'eligible_filter': filters.get('eligible', False),
     }
     return render(request, 'student/programs/list.html', context)
 
 
+def _detail_etag(request, queryset, *parts):
+    # (updated_at, rasm) — bitta yengil so'rov; variantlar tayyor bo'lganda ham ETag o'zgaradi
+    row = queryset.values_list('updated_at', 'image').first()
+    if row is None:
+        return None
+    updated_at, image = row
+    return make_etag(request, *parts, updated_at, bool(image and get_manifest(image)))
+
+
+def _program_etag(request, pk):
+    applied = pk in get_applied_program_ids(request.user.pk)
+    return _detail_etag(request, Program.objects.filter(pk=pk, is_active=True), 'program', pk, applied)
+
+
 @student_required
+@condition(etag_func=_program_etag)
 def program_detail(request, pk):
     program = get_object_or_404(Program, pk=pk, is_active=True)
-    already_applied = Application.objects.filter(user=request.user, program=program).exists()
     return render(request, 'student/programs/detail.html', {
         'program': program,
-        'already_applied': already_applied,
+        'already_applied': program.pk in get_applied_program_ids(request.user.pk),
     })
 
 
 @student_required
 def program_apply(request, pk):
     program = get_object_or_404(Program, pk=pk, is_active=True)
-    if Application.objects.filter(user=request.user, program=program).exists():
+    if program.pk in get_applied_program_ids(request.user.pk):
         messages.warning(request, "Siz bu dasturga allaqachon ariza topshirgansiz!")
         return redirect('student:program_detail', pk=pk)
 
@@ -159,10 +170,22 @@ def program_apply(request, pk):
     if request.method == 'POST':
         form = ApplicationForm(request.POST)
         if form.is_valid():
+            if settings.APPLICATION_QUEUE:
+                enqueue_application(request.user.pk, program.pk, form.cleaned_data['message'])
+                mark_applied(request.user.pk, program.pk)
+                messages.success(request, "Arizangiz qabul qilindi! Tez orada arizalar ro'yxatida paydo bo'ladi.")
+                return redirect('student:my_applications')
             app = form.save(commit=False)
             app.user = request.user
             app.program = program
-            app.save()
+            # Oldindan exists() tekshiruvi yo'q: bir vaqtdagi ikki so'rovdan faqat bittasi
+            # application_user_program_uniq cheklovidan o'tadi, ikkinchisi shu yerda ushlanadi
+            try:
+                with transaction.atomic():
+                    app.save()
+            except IntegrityError:
+                messages.warning(request, "Siz bu dasturga allaqachon ariza topshirgansiz!")
+                return redirect('student:program_detail', pk=pk)
             messages.success(request, "Arizangiz muvaffaqiyatli topshirildi!")
             return redirect('student:my_applications')
     return render(request, 'student/programs/apply.html', {
@@ -210,7 +233,12 @@ def event_list(request):
     })
 
 
+def _event_etag(request, pk):
+    return _detail_etag(request, Event.objects.filter(pk=pk, is_active=True), 'event', pk)
+
+
 @student_required
+@condition(etag_func=_event_etag)
 def event_detail(request, pk):
     event = get_object_or_404(Event, pk=pk, is_active=True)
     return render(request, 'student/events/detail.html', {'event': event})
@@ -220,7 +248,7 @@ def event_detail(request, pk):
 
 @student_required
 def laboratory_list(request):
-    labs = Laboratory.objects.filter(is_active=True)
+    labs = get_laboratories()
     return render(request, 'student/laboratories.html', {'laboratories': labs})
 
 
@@ -267,15 +295,42 @@ def my_certificates(request):
     return render(request, 'student/certificates.html', {'certificates': certificates})
 
 
+@student_required
+def certificate_download(request, pk):
+    # Ruxsat: sertifikat egasi yoki admin. Fayl baytlari Python orqali nusxalanmaydi
+    certificate = get_object_or_404(Certificate.objects.only('user_id', 'pdf_file', 'certificate_id'), pk=pk)
+    if certificate.user_id != request.user.id and not request.user.is_admin_user:
+        raise Http404
+    if not certificate.pdf_file:
+        raise Http404
+    ext = os.path.splitext(certificate.pdf_file.name)[1]
+    return protected_file_response(
+        request, certificate.pdf_file.storage, certificate.pdf_file.name,
+        filename=f'{certificate.certificate_id}{ext}',
+    )
+
+
 # ==================== NEWS ====================
 
+def _news_list_etag(request):
+    # O'chirilgan yangilik max(updated_at) ni o'zgartirmaydi — soni ham hisobga olinadi
+    state = News.objects.filter(is_published=True).aggregate(updated=Max('updated_at'), total=Count('id'))
+    return make_etag(request, 'news_list', state['updated'], state['total'])
+
+
+def _news_etag(request, slug):
+    return _detail_etag(request, News.objects.filter(slug=slug, is_published=True), 'news', slug)
+
+
 @student_required
+@condition(etag_func=_news_list_etag)
 def news_list(request):
     news = News.objects.filter(is_published=True)
     return render(request, 'student/news/list.html', {'news_items': news})
 
 
 @student_required
+@condition(etag_func=_news_etag)
 def news_detail(request, slug):
     article = get_object_or_404(News, slug=slug, is_published=True)
     return render(request, 'student/news/detail.html', {'article': article})